@@ -4,7 +4,12 @@ Pumpfuse Google Sheets Cleaner
 This script connects to a Google Sheet containing pumpfuse logger data, detects missing timestamps based on delta analysis, and interpolates missing rows as needed. Cleaned rows are marked in column D.
 
 Usage:
-    python clean.py <start_row_number>
+    python clean.py <start_row_number> [--no-cache]
+
+Command Line Arguments:
+    start_row_number  Row number to start cleaning at.
+    --no-cache        Always download the sheet instead of reusing a local snapshot taken since its last edit.
+    -h, --help        Show usage instructions
 
 Configuration:
     - Requires a config.ini file with Google API credentials and sheet name.
@@ -12,30 +17,57 @@ Configuration:
 
 """
 
+import argparse
 import sys
+import os
+import json
+import math
 import configparser
 import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import time
+import functools
+from collections import deque
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from tqdm import tqdm
 import logging
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
 
 CLEANED_MARK = 'cleaned'
 DELTA_AVG_WINDOW = 5
 DELTA_TOLERANCE = 0.2  # 20% tolerance for delta comparison
+DELTA_FORMULA_TEMPLATE = '=IF(ISDATE(B{r}),ROUND((B{r}-B{p})*24,2),)'
+TIMESTAMP_FORMULA_TEMPLATE = '=DATE({0.year},{0.month},{0.day})+TIME({0.hour},{0.minute},{0.second})'
+CACHE_DIR = '.cache'
+BATCH_CHUNK_SIZE = 100  # Gap fills per Sheets API batchUpdate call
+SHEETS_WRITE_QUOTA_PER_MINUTE = 300  # Sheets API write requests allowed per minute
+MAX_API_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+class GapFill(NamedTuple):
+    """The Sheets API requests that fill one run of missing rows."""
+    insert_request: Dict[str, Any]
+    update_requests: List[Dict[str, Any]]
+    rows_inserted: int
 
 # Set up logging to a file
 logging.basicConfig(filename='clean_errors.log', level=logging.ERROR, 
                     format='%(asctime)s %(levelname)s: %(message)s')
 
+_CONFIG_CACHE: Dict[str, Any] = {}
+
 def read_config() -> Dict[str, Any]:
-    """Read Google Sheets configuration from config.ini."""
+    """Read Google Sheets configuration from config.ini, parsing the file only once per process."""
+    if 'google' in _CONFIG_CACHE:
+        return _CONFIG_CACHE['google']
     try:
         config = configparser.ConfigParser()
         config.read('config.ini')
-        return config['google']
+        return _CONFIG_CACHE.setdefault('google', config['google'])
     except KeyError as e:
         logging.error(f"Missing section or key in config: {e}")
         print('Configuration file is missing required section or key. See clean_errors.log for details.')
@@ -49,15 +81,63 @@ def read_config() -> Dict[str, Any]:
         print('Failed to read configuration. See clean_errors.log for details.')
         sys.exit(1)
 
+class RateLimiter:
+    """Sliding-window limiter that only blocks once the per-minute request quota is used up."""
+
+    def __init__(self, rate_per_minute: int = SHEETS_WRITE_QUOTA_PER_MINUTE) -> None:
+        self.rate_per_minute = rate_per_minute
+        self.calls: deque[float] = deque()
+
+    def acquire(self) -> None:
+        """Wait until a request may be sent without exceeding the quota, then record it."""
+        now = time.monotonic()
+        while self.calls and now - self.calls[0] >= 60:
+            self.calls.popleft()
+        if len(self.calls) >= self.rate_per_minute:
+            time.sleep(60 - (now - self.calls[0]))
+            self.calls.popleft()
+        self.calls.append(time.monotonic())
+
+write_limiter = RateLimiter()
+
+def rate_limited(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Pace a Sheets API call through the write limiter and back off exponentially on HTTP 429."""
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        delay = BACKOFF_BASE_SECONDS
+        for attempt in range(MAX_API_RETRIES + 1):
+            write_limiter.acquire()
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                if e.response.status_code != 429 or attempt == MAX_API_RETRIES:
+                    raise
+                retry_after = e.response.headers.get('Retry-After')
+                wait = float(retry_after) if retry_after and retry_after.isdigit() else delay
+                logging.error(f"Rate limited calling {func.__name__}; retrying in {wait:.0f} s")
+                time.sleep(min(wait, BACKOFF_MAX_SECONDS))
+                delay = min(delay * 2, BACKOFF_MAX_SECONDS)
+    return wrapper
+
+def configure_session(client: gspread.Client) -> None:
+    """Mount a pooled, retrying HTTP adapter on the client's authorized session.
+
+    The session is shared by every call the client makes, so the TLS connection is kept alive between
+    requests. Transient 429/5xx responses on idempotent requests are retried with exponential backoff;
+    POST batchUpdate calls are not retried here because replaying an insert would duplicate rows.
+    """
+    # gspread >= 6 keeps the session on an HTTPClient; older versions keep it on the client itself
+    session = client.http_client.session if hasattr(client, 'http_client') else client.session
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount('https://', adapter)
+
 def get_gsheet(target_sheet_name: str, credentials_json: str) -> gspread.Worksheet:
     """Connect to Google Sheets and return the worksheet object."""
     try:
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive',
-        ]
-        creds = ServiceAccountCredentials.from_json_keyfile_name(credentials_json, scope)
-        client = gspread.authorize(creds)
+        # google-auth credentials with gspread's default Sheets and Drive scopes
+        client = gspread.service_account(filename=credentials_json)
+        configure_session(client)
         sheet = client.open(target_sheet_name).sheet1
         return sheet
     except Exception as e:
@@ -65,123 +145,272 @@ def get_gsheet(target_sheet_name: str, credentials_json: str) -> gspread.Workshe
         print('Failed to connect to Google Sheet. See clean_errors.log for details.')
         sys.exit(1)
 
+def snapshot_path(sheet: gspread.Worksheet) -> str:
+    """Return the path of the local snapshot file for the given worksheet."""
+    return os.path.join(CACHE_DIR, f'{sheet.spreadsheet.id}_{sheet.id}.json')
+
+def cached_get_all_values(sheet: gspread.Worksheet, use_cache: bool = True) -> list[list[Any]]:
+    """
+    Return sheet.get_all_values(), served from a local snapshot if the spreadsheet has not been modified since it was saved.
+    The snapshot is keyed on the spreadsheet's Drive lastUpdateTime, which changes on every edit made by this
+    script, import.py, getweather.py or a person, so a plan is never built against stale rows.
+    """
+    path = snapshot_path(sheet)
+    try:
+        revision = sheet.spreadsheet.get_lastUpdateTime()
+    except Exception as e:
+        logging.error(f"Could not read the sheet's last update time, downloading it: {e}")
+        revision = None
+    if use_cache and revision:
+        try:
+            with open(path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('revision') == revision:
+                return snapshot['values']
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, KeyError, AttributeError) as e:
+            logging.error(f"Ignoring unreadable sheet snapshot {path}: {e}")
+    data = sheet.get_all_values()
+    if revision:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'revision': revision, 'values': data}, f)
+        except OSError as e:
+            logging.error(f"Could not save sheet snapshot {path}: {e}")
+    return data
+
+def invalidate_snapshot(sheet: gspread.Worksheet) -> None:
+    """Delete the local snapshot of the worksheet, e.g. once the sheet has been written to."""
+    try:
+        os.remove(snapshot_path(sheet))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.error(f"Could not remove sheet snapshot: {e}")
+
+@functools.lru_cache(maxsize=4096)
 def parse_timestamp(ts_str: str) -> datetime:
     """Parse timestamp string to datetime object."""
-    return datetime.strptime(ts_str, '%Y-%m-%d %H:%M:%S')
+    try:
+        return datetime.fromisoformat(ts_str)
+    except ValueError:
+        # import.py writes hours without a leading zero, which fromisoformat rejects
+        return datetime.strptime(ts_str, '%Y-%m-%d %H:%M:%S')
 
 def format_timestamp(dt: datetime) -> str:
     """Format datetime object to string for Google Sheets, with single digit hours unpadded, and force Sheets datetime format."""
-    return f"=DATE({dt.year},{dt.month},{dt.day})+TIME({dt.hour},{dt.minute},{dt.second})"
+    return TIMESTAMP_FORMULA_TEMPLATE.format(dt)
+
+def delta_formula(row_number: int) -> str:
+    """Return the Delta column formula (hours since the previous row) for the given sheet row."""
+    return DELTA_FORMULA_TEMPLATE.format(r=row_number, p=row_number - 1)
+
+def rounded_delta(prev_ts: datetime, ts: datetime) -> float:
+    """Return the hours between two timestamps as the Delta formula computes them, ROUND(..., 2) half away from zero."""
+    hours = (ts - prev_ts).total_seconds() / 3600
+    return math.copysign(math.floor(abs(hours) * 100 + 0.5) / 100, hours)
+
+def cell_data(value: str) -> Dict[str, Any]:
+    """Return Sheets API CellData for a value, entering formulas as formulas like USER_ENTERED input would."""
+    if not value:
+        return {}
+    if value.startswith('='):
+        return {'userEnteredValue': {'formulaValue': value}}
+    return {'userEnteredValue': {'stringValue': value}}
+
+def update_cells_request(sheet_id: int, row_index: int, column_index: int, rows: List[List[str]]) -> Dict[str, Any]:
+    """Return an updateCells request writing rows of values starting at the given 0-based cell."""
+    return {
+        'updateCells': {
+            'start': {'sheetId': sheet_id, 'rowIndex': row_index, 'columnIndex': column_index},
+            'rows': [{'values': [cell_data(value) for value in row]} for row in rows],
+            'fields': 'userEnteredValue',
+        }
+    }
 
 def get_float(val: Any) -> float | None:
     """Convert value to float if possible, else None."""
+    if isinstance(val, str):
+        # Blank cells and plain decimals are the common cases; settle them without raising an exception
+        if not val:
+            return None
+        digits = val[1:] if val[0] == '-' else val
+        if digits.replace('.', '', 1).isdecimal():
+            return float(val)
     try:
         return float(val)
     except (TypeError, ValueError):
         return None
 
-def clean_sheet(sheet: gspread.Worksheet, start_row: int, total_writes: int | None = None) -> int:
-    """Clean the Google Sheet by interpolating missing rows and updating delta formulas."""
+def parse_deltas(data: list[list[Any]]) -> np.ndarray:
+    """Return the Delta column (C) as a float array, with NaN where a cell is not a number."""
+    return np.array([get_float(r[2]) for r in data], dtype=np.float64)  # None becomes NaN
+
+def find_gap_candidates(deltas: np.ndarray) -> np.ndarray:
+    """
+    Return the indices of rows whose delta spans several average intervals, judged on the original data.
+
+    Applies the same test as measure_gap to every row at once. Rows within DELTA_AVG_WINDOW of a filled
+    gap see interpolated deltas in their window and must still be checked individually.
+    """
+    mask = np.zeros(len(deltas), dtype=bool)
+    if len(deltas) > DELTA_AVG_WINDOW:
+        # windows[j] holds the deltas of the rows preceding row j + DELTA_AVG_WINDOW
+        windows = sliding_window_view(deltas[:-1], DELTA_AVG_WINDOW)
+        avg_delta = windows.sum(axis=1) / DELTA_AVG_WINDOW
+        curr_delta = deltas[DELTA_AVG_WINDOW:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n_missing = np.rint(curr_delta / avg_delta)
+            mask[DELTA_AVG_WINDOW:] = (n_missing > 1) & (
+                np.abs(curr_delta - n_missing * avg_delta) < DELTA_TOLERANCE * avg_delta * n_missing
+            )
+    # Windows reaching back to the header or the first data row (which has no delta) are incomplete
+    mask[:DELTA_AVG_WINDOW + 2] = False
+    return np.flatnonzero(mask)
+
+def measure_gap(data: list[list[Any]], row: int) -> Tuple[int, float, float] | None:
+    """Return (n_missing, avg_delta, curr_delta) if the delta at data[row] spans missing rows, else None."""
+    # Rows 0 and 1 (header and first data row) never count towards the window
+    window_start = max(row - DELTA_AVG_WINDOW, 2)
+    if row - window_start < DELTA_AVG_WINDOW:
+        return None
+    prev_deltas = [get_float(r[2]) for r in data[window_start:row]]
+    if None in prev_deltas:
+        return None
+    avg_delta = sum(prev_deltas) / DELTA_AVG_WINDOW
+    curr_delta = get_float(data[row][2])
+    if curr_delta is None or avg_delta == 0:
+        return None
+    n_missing = round(curr_delta / avg_delta)
+    if n_missing > 1 and abs(curr_delta - n_missing * avg_delta) < DELTA_TOLERANCE * avg_delta * n_missing:
+        return n_missing, avg_delta, curr_delta
+    return None
+
+def build_batch_requests(data: list[list[Any]], start_row: int, sheet_id: int) -> List[GapFill]:
+    """
+    Plan every gap fill in a single in-memory pass over the sheet data.
+
+    Returns one GapFill per gap, in sheet order.
+    Requests address rows by their position in the original sheet, so the plan must be applied
+    bottom-up: inserting below a gap never moves it. The interpolated rows are mirrored into a local
+    copy of the data as Sheets will evaluate them: timestamps truncated to the second by the DATE()+TIME()
+    formula, and deltas rounded from those timestamps by the Delta formula. The delta window for later
+    rows then matches what a re-read of the sheet would return.
+    """
+    deltas = parse_deltas(data)
+    candidates = find_gap_candidates(deltas)
+    data = list(data)
+    plan = []
+    offset = 0  # rows inserted so far, i.e. how far the original rows have shifted down
+    dirty_until = -1  # last original row whose delta window includes interpolated rows
+    orig = start_row
+    while orig < len(deltas):
+        if orig > dirty_until:
+            # The delta window is unchanged from the original data, so jump straight to the next candidate
+            next_candidate = np.searchsorted(candidates, orig)
+            if next_candidate == len(candidates):
+                break
+            orig = int(candidates[next_candidate])
+        row = orig + offset
+        gap = measure_gap(data, row)
+        if gap is None:
+            orig += 1
+            continue
+        n_missing, avg_delta, _ = gap
+        prev_ts = parse_timestamp(data[row - 1][1])
+        new_rows = []
+        mirrored_rows = []
+        mirrored_ts = prev_ts
+        for n in range(1, n_missing):
+            new_ts = prev_ts + timedelta(hours=avg_delta * n)
+            insert_row_index = orig + n
+            # Insert CLEANED_MARK in column G (index 7)
+            new_rows.append([
+                '',
+                format_timestamp(new_ts),
+                delta_formula(insert_row_index),
+                '', '', '', CLEANED_MARK
+            ])
+            # TIME() takes whole seconds, so the sheet holds the timestamp without its microseconds
+            sheet_ts = new_ts.replace(microsecond=0)
+            mirrored_rows.append([
+                '', sheet_ts.strftime('%Y-%m-%d %H:%M:%S'), f'{rounded_delta(mirrored_ts, sheet_ts):.2f}',
+                '', '', '', CLEANED_MARK
+            ])
+            mirrored_ts = sheet_ts
+        insert_request = {
+            'insertDimension': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'dimension': 'ROWS',
+                    'startIndex': orig,
+                    'endIndex': orig + n_missing - 1,
+                },
+                'inheritFromBefore': False,
+            }
+        }
+        update_requests = [
+            update_cells_request(sheet_id, orig, 0, new_rows),
+            update_cells_request(sheet_id, orig + n_missing - 1, 2, [[delta_formula(orig + n_missing)]]),
+        ]
+        plan.append(GapFill(insert_request, update_requests, n_missing - 1))
+        gap_row = list(data[row])
+        gap_row[2] = f'{rounded_delta(mirrored_ts, parse_timestamp(gap_row[1])):.2f}'
+        data[row:row + 1] = mirrored_rows + [gap_row]
+        offset += n_missing - 1
+        dirty_until = orig + DELTA_AVG_WINDOW
+        orig += 1
+    return plan
+
+@rate_limited
+def submit_batch(sheet: gspread.Worksheet, requests: List[Dict[str, Any]]) -> None:
+    """Submit requests in a single spreadsheets.batchUpdate call, which Sheets applies atomically and in order."""
+    sheet.spreadsheet.batch_update({'requests': requests})
+
+def clean_sheet(sheet: gspread.Worksheet, plan: List[GapFill]) -> int:
+    """
+    Clean the Google Sheet by applying the planned row inserts and delta formula updates.
+
+    Gaps are applied from the bottom of the sheet up, so each insert only shifts rows that have already
+    been written. Chunks are still submitted one at a time: a higher chunk applied before a lower one
+    would shift the rows the lower chunk addresses, so they cannot be sent concurrently.
+    """
     try:
-        data = sheet.get_all_values()
-        row = start_row
-        total_rows = len(data)
         rows_added = 0
-        write_ops = 0
-        pbar_total = total_writes if total_writes is not None else (total_rows - start_row)
-        with tqdm(total=pbar_total, desc="Processing writes", unit=" writes") as pbar:
-            while row < len(data):
-                prev_deltas = []
-                for i in range(row - DELTA_AVG_WINDOW, row):
-                    if i > 1:
-                        delta = get_float(data[i][2])
-                        if delta is not None:
-                            prev_deltas.append(delta)
-                if len(prev_deltas) < DELTA_AVG_WINDOW:
-                    row += 1
+        if plan:
+            # The snapshot no longer matches the sheet once any batch is written
+            invalidate_snapshot(sheet)
+        pbar_total = sum(gap.rows_inserted + 1 for gap in plan)
+        bottom_up = plan[::-1]
+        # Progress advances once per batch, so smooth the ETA over batches of different sizes
+        with tqdm(total=pbar_total, desc="Processing writes", unit=" writes", mininterval=1.0, smoothing=0.1) as pbar:
+            for chunk_start in range(0, len(bottom_up), BATCH_CHUNK_SIZE):
+                chunk = bottom_up[chunk_start:chunk_start + BATCH_CHUNK_SIZE]
+                first_row = chunk[0].insert_request['insertDimension']['range']['startIndex'] + 1
+                try:
+                    submit_batch(sheet, [request for gap in chunk for request in (gap.insert_request, *gap.update_requests)])
+                except Exception as e:
+                    # Gaps above this batch do not depend on it, so carry on with the rest of the plan
+                    logging.error(f"Error writing batch starting at row {first_row}: {e}")
+                    print(f"Error writing batch starting at row {first_row}. See clean_errors.log for details.")
                     continue
-                avg_delta = sum(prev_deltas) / DELTA_AVG_WINDOW
-                curr_delta = get_float(data[row][2])
-                if curr_delta is None:
-                    row += 1
-                    continue
-                n_missing = round(curr_delta / avg_delta)
-                if n_missing > 1 and abs(curr_delta - n_missing * avg_delta) < DELTA_TOLERANCE * avg_delta * n_missing:
-                    prev_ts = parse_timestamp(data[row - 1][1])
-                    for n in range(1, n_missing):
-                        new_ts = prev_ts + timedelta(hours=avg_delta * n)
-                        insert_row_index = row + n
-                        # Insert CLEANED_MARK in column G (index 7)
-                        insert_row = [
-                            '',
-                            format_timestamp(new_ts),
-                            f'=IF(ISDATE(B{insert_row_index}),ROUND((B{insert_row_index}-B{insert_row_index - 1})*24,2),)',
-                            '', '', '', CLEANED_MARK
-                        ]
-                        try:
-                            sheet.insert_row(insert_row, insert_row_index, value_input_option='USER_ENTERED')
-                        except Exception as e:
-                            logging.error(f"Error inserting row at {insert_row_index}: {e}")
-                            print(f"Error inserting row at {insert_row_index}. See clean_errors.log for details.")
-                            continue
-                        time.sleep(1.2)
-                        rows_added += 1
-                        write_ops += 1
-                        pbar.update(1)
-                    updated_delta_formula = f'=IF(ISDATE(B{row + n_missing}),ROUND((B{row + n_missing}-B{row + n_missing - 1})*24,2),)'
-                    try:
-                        sheet.update_cell(row + n_missing, 3, updated_delta_formula)
-                    except Exception as e:
-                        logging.error(f"Error updating delta formula at row {row + n_missing}: {e}")
-                        print(f"Error updating delta formula at row {row + n_missing}. See clean_errors.log for details.")
-                    time.sleep(1.2)
-                    write_ops += 1
-                    pbar.update(1)
-                    data = sheet.get_all_values()
-                    row += n_missing
-                else:
-                    row += 1
+                chunk_rows = sum(gap.rows_inserted for gap in chunk)
+                rows_added += chunk_rows
+                pbar.update(chunk_rows + len(chunk))
         return rows_added
     except Exception as e:
         logging.error(f"Error in clean_sheet: {e}")
         print('An error occurred during cleaning. See clean_errors.log for details.')
         return 0
 
-def estimate_rows_to_insert(data: list[list[Any]], start_row: int) -> Tuple[int, int]:
-    """Preprocess the data to estimate how many rows will be inserted during cleaning."""
-    row = start_row
-    rows_to_insert = 0
-    update_ops = 0
-    while row < len(data):
-        prev_deltas = []
-        for i in range(row - DELTA_AVG_WINDOW, row):
-            if i > 1:
-                delta = get_float(data[i][2])
-                if delta is not None:
-                    prev_deltas.append(delta)
-        if len(prev_deltas) < DELTA_AVG_WINDOW:
-            row += 1
-            continue
-        avg_delta = sum(prev_deltas) / DELTA_AVG_WINDOW
-        curr_delta = get_float(data[row][2])
-        if curr_delta is None:
-            row += 1
-            continue
-        n_missing = round(curr_delta / avg_delta)
-        if n_missing > 1 and abs(curr_delta - n_missing * avg_delta) < DELTA_TOLERANCE * avg_delta * n_missing:
-            rows_to_insert += n_missing - 1
-            update_ops += 1  # for the delta formula update
-            row += n_missing
-        else:
-            row += 1
-    return rows_to_insert, update_ops
-
-def estimate_processing_time(sheet: gspread.Worksheet, start_row: int) -> Tuple[int, int, float]:
-    """Estimate the number of write operations and total time required, using preprocessing for accuracy."""
-    data = sheet.get_all_values()
-    rows_to_insert, update_ops = estimate_rows_to_insert(data, start_row)
-    total_writes = rows_to_insert + update_ops
-    estimated_seconds = total_writes * 1.2
+def estimate_processing_time(plan: List[GapFill]) -> Tuple[int, int, float]:
+    """Estimate the number of write operations and total time required for the planned gap fills."""
+    rows_to_insert = sum(gap.rows_inserted for gap in plan)
+    update_ops = len(plan)  # one delta formula update per gap
+    batch_calls = math.ceil(update_ops / BATCH_CHUNK_SIZE)
+    estimated_seconds = batch_calls * 60 / SHEETS_WRITE_QUOTA_PER_MINUTE
     return rows_to_insert, update_ops, estimated_seconds
 
 def main() -> None:
@@ -193,21 +422,35 @@ def main() -> None:
             sys.exit(0)
         signal.signal(signal.SIGINT, handle_sigint)
 
-        if len(sys.argv) != 2:
-            print('Usage: python clean.py <start_row_number>')
-            sys.exit(1)
-        try:
-            start_row = int(sys.argv[1])
-        except ValueError:
-            print('Start row number must be an integer.')
-            sys.exit(1)
+        parser = argparse.ArgumentParser(
+            description="Interpolate missing PumpFuse run events in the target Google Sheet."
+        )
+        parser.add_argument(
+            'start_row', type=int,
+            help="Row number to start cleaning at (suggest one row before the row printed by import.py)."
+        )
+        parser.add_argument(
+            '--no-cache', action='store_true',
+            help="Always download the sheet instead of reusing a local snapshot saved since its last edit."
+        )
+        args = parser.parse_args()
+        start_row = args.start_row
         config = read_config()
-        sheet = get_gsheet(config['target_sheet_name'], config['credentials_json'])
-        rows_to_process = len(sheet.get_all_values()) - start_row
+        # Older config files name the target sheet 'sheet_name'; check before spending time on authentication
+        target_sheet_name = config.get('target_sheet_name') or config.get('sheet_name')
+        credentials_json = config.get('credentials_json')
+        if not target_sheet_name or not credentials_json:
+            logging.error("config.ini [google] section must set target_sheet_name and credentials_json")
+            print('Configuration file is missing target_sheet_name or credentials_json. See clean_errors.log for details.')
+            sys.exit(1)
+        sheet = get_gsheet(target_sheet_name, credentials_json)
+        # Download the sheet once and plan every edit up front; estimation and cleaning share the plan
+        data = cached_get_all_values(sheet, use_cache=not args.no_cache)
+        rows_to_process = len(data) - start_row
         print(f"Rows to process: {rows_to_process}")
-        rows_to_insert, update_ops, estimated_seconds = estimate_processing_time(sheet, start_row)
+        plan = build_batch_requests(data, start_row, sheet.id)
+        rows_to_insert, update_ops, estimated_seconds = estimate_processing_time(plan)
         estimated_minutes = estimated_seconds / 60
-        total_writes = rows_to_insert + update_ops
         print(f"Estimated rows to insert: {rows_to_insert}")
         print(f"Estimated delta formula updates: {update_ops}")
         print(f"Estimated time: {estimated_minutes:.1f} minutes ({estimated_seconds:.0f} seconds)")
@@ -216,7 +459,7 @@ def main() -> None:
             if proceed != 'y':
                 print('Aborted by user.')
                 sys.exit(0)
-        rows_added = clean_sheet(sheet, start_row, total_writes=total_writes)
+        rows_added = clean_sheet(sheet, plan)
         print(f'Cleaning complete. Rows added: {rows_added}')
     except Exception as e:
         logging.error(f"Fatal error in main: {e}")
@@ -31,9 +31,9 @@ import configparser
 import logging
 from datetime import datetime
 from typing import List, Optional
-import gspread
+from gspread.utils import rowcol_to_a1
 from gspread.worksheet import Worksheet
-from oauth2client.service_account import ServiceAccountCredentials
+from sheets_util import get_gspread_client, latest_column_datetime, with_jitter_retry
 
 # Set up logging
 logging.basicConfig(
@@ -48,56 +48,25 @@ def load_config(config_path: str = 'config.ini') -> configparser.ConfigParser:
     config.read(config_path)
     return config
 
-def get_gspread_client(credentials_path: str) -> gspread.Client:
-    """Authenticate and return a gspread client."""
-    scope = [
-        'https://spreadsheets.google.com/feeds',
-        'https://www.googleapis.com/auth/drive',
-    ]
-    creds = ServiceAccountCredentials.from_json_keyfile_name(credentials_path, scope)
-    return gspread.authorize(creds)
-
 def get_most_recent_timestamp(ws: Worksheet, timestamp_col: str = 'Timestamp', expected_headers: Optional[List[str]] = None) -> Optional[datetime]:
     """
     Get the most recent datetime from the given worksheet's timestamp column.
-    Handles duplicate headers gracefully. Allows a single empty header if present, as in the case of a blank column A.
-    Optionally accepts expected_headers to override worksheet headers.
+    Only the timestamp column is downloaded. Its position is taken from expected_headers when given,
+    as in the case of a blank column A, otherwise from the worksheet's header row.
+    Rows are appended in time order, so after the first run only the rows from about where the previous run
+    found the last timestamp are read, and the result is cached against the spreadsheet's last modified time.
     """
     try:
         if expected_headers:
-            records = ws.get_all_records(expected_headers=expected_headers)
+            # The caller controls expected_headers and checks them for duplicates once per run
             headers = expected_headers
         else:
-            records = ws.get_all_records()
-            headers = list(records[0].keys()) if records else []
-        # Check for duplicate headers (allow a single empty string)
-        header_counts = {}
-        for h in headers:
-            header_counts[h] = header_counts.get(h, 0) + 1
-        duplicates = [k for k, v in header_counts.items() if v > 1]
-        if duplicates:
-            logging.error(f"Header row contains duplicate values: {headers}")
-            return None
-        timestamps = [r[timestamp_col] for r in records if r.get(timestamp_col)]
-        # Try parsing all timestamps
-        dt_list = []
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%b %d, %Y, %I:%M:%S %p',
-            '%b %d, %Y, %I:%M %p'
-        ]
-        for t in timestamps:
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(t, fmt)
-                    dt_list.append(dt)
-                    break
-                except ValueError:
-                    continue
-        if not dt_list:
-            return None
-        return max(dt_list)
+            headers = with_jitter_retry(ws.row_values, 1)
+            if headers.count(timestamp_col) != 1:
+                logging.error(f"Header row must contain exactly one '{timestamp_col}' column: {headers}")
+                return None
+        column = rowcol_to_a1(1, headers.index(timestamp_col) + 1)[:-1]
+        return latest_column_datetime(ws, column)
     except Exception as e:
         logging.error(f"Error finding most recent timestamp: {e}")
         return None
@@ -114,12 +83,21 @@ def main() -> None:
         config = load_config()
         credentials_path = config['google']['credentials_json']
         target_sheet_name = config['google']['target_sheet_name']
-        # Open the spreadsheet and Data worksheet
+        target_sheet_id = config['google'].get('target_sheet_id')
+        # Open the spreadsheet and Data worksheet; opening by key skips the Drive search by name
         client = get_gspread_client(credentials_path)
-        sh = client.open(target_sheet_name)
-        ws = sh.worksheet('Data')
+        if target_sheet_id:
+            sh = with_jitter_retry(client.open_by_key, target_sheet_id)
+        else:
+            sh = with_jitter_retry(client.open, target_sheet_name)
+        ws = with_jitter_retry(sh.worksheet, 'Data')
         # Use explicit headers for blank column A
         expected_headers = ['', 'Timestamp', 'Delta']
+        non_empty = [h for h in expected_headers if h]
+        if len(set(non_empty)) != len(non_empty):
+            logging.error(f"Expected headers contain duplicate values: {expected_headers}")
+            print(f"Error: duplicate expected headers {expected_headers}")
+            return
         most_recent = get_most_recent_timestamp(ws, timestamp_col='Timestamp', expected_headers=expected_headers)
         if most_recent:
             print(f"Latest date in {target_sheet_name} is: {most_recent}")
@@ -13,15 +13,92 @@ Configuration, credentials, and user-specific settings are managed via config.in
 
 import configparser
 import logging
-from typing import Optional
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
-import gspread
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
+)
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.edge.options import Options
+from selenium.webdriver.edge.service import Service
+from sheets_util import get_gspread_client, latest_column_datetime, with_jitter_retry
+
+# Selenium locators for the Looker Studio report and the exported Google Sheet.
+# CSS selectors where the element has a stable attribute; XPath only where it must be matched by its text.
+DATE_SELECTOR_LOCATOR = (By.CLASS_NAME, "date-text")
+CALENDAR_LOCATOR = (By.CLASS_NAME, "mat-calendar")
+# Angular Material labels each calendar cell with its full date, e.g. "September 15, 2024"
+DAY_CELL_CSS_TEMPLATE = ".mat-calendar-body-cell[aria-label='{0:%B} {0.day}, {0.year}']"
+DAY_CELL_XPATH_TEMPLATE = "//span[contains(@class, 'mat-calendar-body-cell-content') and normalize-space(text())='{}']"
+APPLY_BUTTON_LOCATOR = (By.XPATH, "//button[.//span[normalize-space(text())='Apply']] | //span[normalize-space(text())='Apply']")
+FIRST_DATA_ROW_LOCATOR = (By.CSS_SELECTOR, ".centerColsContainer .row.block-0.index-0")
+EXPORT_OPTION_LOCATOR = (By.CSS_SELECTOR, "button[data-test-id='Export']")
+EXPORT_NAME_INPUT_LOCATOR = (By.CSS_SELECTOR, "input.export-name-field")
+GOOGLE_SHEETS_LABEL_LOCATOR = (By.XPATH, "//label[contains(., 'Google Sheets')]")
+EXPORT_BUTTON_LOCATOR = (By.XPATH, "//button[.//span[contains(text(),'Export')]]")
+SHEET_SHARE_BUTTON_LOCATOR = (By.CSS_SELECTOR, "div[role='button'][aria-label*='Share']")
+SHARE_EMAIL_INPUT_LOCATOR = (By.CSS_SELECTOR, "input[aria-label='Add people, groups, and calendar events']")
+NOTIFY_CHECKBOX_LOCATOR = (By.CSS_SELECTOR, "input[type='checkbox'][name='notify']")
+DIALOG_SHARE_BUTTON_LOCATOR = (By.XPATH, "//button[.//span[text()='Share']]")
+DIALOG_SEND_BUTTON_LOCATOR = (By.XPATH, "//button[.//span[contains(text(),'Send')]]")
+SHARE_DIALOG_IFRAME_LOCATOR = (By.CSS_SELECTOR, "iframe[src*='sharing']")
+SHARE_SUGGESTION_LOCATOR = (By.CSS_SELECTOR, "[role='listbox'] [role='option']")
+# Scrolls without the smooth animation, which can race with the click that follows
+SCROLL_INTO_VIEW_JS = "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});"
+# Clicks a node only if it is rendered and not disabled, mirroring element_to_be_clickable; returns whether it clicked
+CLICK_IF_CLICKABLE_JS = """
+const clickIfClickable = (node) => {
+    if (node === null || node.getClientRects().length === 0) { return false; }
+    if (node.disabled || node.getAttribute('aria-disabled') === 'true') { return false; }
+    node.click();
+    return true;
+};
+"""
+# Locates the first node matching an XPath and clicks it in one driver round trip if it is clickable
+CLICK_XPATH_JS = CLICK_IF_CLICKABLE_JS + """
+return clickIfClickable(document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+"""
+# Locates the first element matching a CSS selector and clicks it in one driver round trip if it is clickable
+CLICK_CSS_JS = CLICK_IF_CLICKABLE_JS + """
+return clickIfClickable(document.querySelector(arguments[0]));
+"""
+# Selects the radio input a label points to: null if the label has no input, false if it was already selected
+SELECT_LABELLED_RADIO_JS = """
+const input = arguments[0].htmlFor ? document.getElementById(arguments[0].htmlFor) : null;
+if (!input) { return null; }
+if (input.checked) { return false; }
+input.click();
+return true;
+"""
+WAIT_POLL_SECONDS = 0.1  # Selenium's default of 0.5 s is the latency floor of every explicit wait
+SUGGESTION_TIMEOUT = 5  # Seconds to wait for the share dialog's address autocomplete
+EDGE_DEBUGGING_HOST = "127.0.0.1"
+EDGE_DEBUGGING_PORT = 9222  # Edge is launched with this port open so later runs can attach to it
+
+_CONFIG_CACHE: Dict[str, configparser.ConfigParser] = {}
+
+def get_config(config_path: str = "config.ini") -> configparser.ConfigParser:
+    """
+    Returns the parsed configuration file, reading it only on first use.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+
+    Returns:
+        configparser.ConfigParser: The parsed configuration.
+    """
+    if config_path not in _CONFIG_CACHE:
+        config = configparser.ConfigParser()
+        config.read(config_path)
+        _CONFIG_CACHE[config_path] = config
+    return _CONFIG_CACHE[config_path]
 
 def get_latest_datetime_from_sheet(config_path: str = "config.ini") -> Optional[datetime]:
     """
@@ -33,59 +110,67 @@ def get_latest_datetime_from_sheet(config_path: str = "config.ini") -> Optional[
     Returns:
         Optional[datetime]: The latest datetime found in the sheet, or None if not found.
     """
-    config = configparser.ConfigParser()
-    config.read(config_path)
+    config = get_config(config_path)
     credentials_json = config["google"]["credentials_json"]
     target_sheet_name = config["google"]["target_sheet_name"]
-
-    gc = gspread.service_account(filename=credentials_json)
-    sh = gc.open(target_sheet_name)
-    worksheet = sh.sheet1  # Adjust if not the first sheet
-    # Use explicit headers to avoid duplicate header issues (adjust as needed)
-    expected_headers = ['', 'Timestamp', 'Delta']
+    target_sheet_id = config.get("google", "target_sheet_id", fallback=None)
+
+    gc = get_gspread_client(credentials_json)
+    # Opening by key skips the Drive search that opening by name needs
+    if target_sheet_id:
+        sh = with_jitter_retry(gc.open_by_key, target_sheet_id)
+    else:
+        sh = with_jitter_retry(gc.open, target_sheet_name)
+    worksheet = with_jitter_retry(sh.get_worksheet, 0)  # Adjust if not the first sheet
+    # Timestamps are in column B (column A is blank). An unmodified sheet is not re-read, and a modified one
+    # only from about the row where the previous run found the last timestamp.
     try:
-        records = worksheet.get_all_records(expected_headers=expected_headers)
-        headers = expected_headers
-        # Check for duplicate headers (allow a single empty string)
-        header_counts = {}
-        for h in headers:
-            header_counts[h] = header_counts.get(h, 0) + 1
-        duplicates = [k for k, v in header_counts.items() if v > 1]
-        if duplicates:
-            logging.error(f"Header row contains duplicate values: {headers}")
-            return None
-        # Find the latest datetime in the 'Timestamp' column
-        timestamps = [r['Timestamp'] for r in records if r.get('Timestamp')]
-        dt_list = []
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%b %d, %Y, %I:%M:%S %p',
-            '%b %d, %Y, %I:%M %p'
-        ]
-        for t in timestamps:
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(t, fmt)
-                    dt_list.append(dt)
-                    break
-                except ValueError:
-                    continue
-        if not dt_list:
+        latest = latest_column_datetime(worksheet, 'B')
+        if latest is None:
             logging.error("No valid datetime found in the latest row.")
-            return None
-        return max(dt_list)
+        return latest
     except Exception as e:
         logging.error(f"Error retrieving latest datetime: {e}")
         return None
 
-def select_looker_date_range(driver: webdriver.Edge, start_day: int, timeout: int = 10) -> bool:
+def fast_wait(driver: webdriver.Edge, timeout: float = 10) -> WebDriverWait:
+    """
+    Returns an explicit wait that polls every WAIT_POLL_SECONDS and retries through re-rendered elements.
+
+    Args:
+        driver (webdriver.Edge): Selenium WebDriver instance.
+        timeout (float): Maximum time to wait (in seconds).
+
+    Returns:
+        WebDriverWait: The configured wait.
+    """
+    return WebDriverWait(
+        driver, timeout, poll_frequency=WAIT_POLL_SECONDS,
+        ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+    )
+
+def first_data_row_ready(driver: webdriver.Edge) -> Any:
+    """
+    Expected condition for the report table: the first data row is displayed and has text.
+
+    Args:
+        driver (webdriver.Edge): Selenium WebDriver instance.
+
+    Returns:
+        Any: The first data row element once it is ready, False otherwise.
+    """
+    rows = driver.find_elements(*FIRST_DATA_ROW_LOCATOR)
+    if rows and rows[0].is_displayed() and rows[0].text.strip():
+        return rows[0]
+    return False
+
+def select_looker_date_range(driver: webdriver.Edge, start_date: datetime, timeout: int = 10) -> bool:
     """
     Opens the Looker Studio date range selector and selects the given start date, then clicks the Apply button.
 
     Args:
         driver (webdriver.Edge): Selenium WebDriver instance.
-        start_day (int): The day of the month to select as the start date.
+        start_date (datetime): The date to select as the start date.
         timeout (int): Maximum time to wait for elements (in seconds).
 
     Returns:
@@ -93,34 +178,27 @@ def select_looker_date_range(driver: webdriver.Edge, start_day: int, timeout: in
     """
     try:
         # Wait for the date range selector to be clickable and click it
-        wait = WebDriverWait(driver, timeout)
-        date_selector = wait.until(
-            EC.element_to_be_clickable((By.CLASS_NAME, "date-text"))
-        )
+        wait = fast_wait(driver, timeout)
+        date_selector = wait.until(EC.element_to_be_clickable(DATE_SELECTOR_LOCATOR))
         date_selector.click()
         logging.info("Clicked date range selector.")
 
         # Wait for the calendar popup to appear
-        calendar_popup = wait.until(
-            EC.visibility_of_element_located((By.CLASS_NAME, "mat-calendar"))
-        )
+        calendar_popup = wait.until(EC.visibility_of_element_located(CALENDAR_LOCATOR))
         logging.info("Calendar popup is visible.")
 
-        # Find the start date cell by its text (day of month)
-        day_xpath = f"//span[contains(@class, 'mat-calendar-body-cell-content') and normalize-space(text())='{start_day}']"
-        start_date_cell = wait.until(
-            EC.element_to_be_clickable((By.XPATH, day_xpath))
-        )
-        start_date_cell.click()
+        # Click the start date cell by its aria-label, falling back to matching the day of month by text
+        # if the cell has no matching label. Each attempt clicks in one round trip and the wait retries
+        # until a cell is displayed and enabled.
+        start_day = start_date.day
+        day_css = DAY_CELL_CSS_TEMPLATE.format(start_date)
+        day_xpath = DAY_CELL_XPATH_TEMPLATE.format(start_day)
+        wait.until(lambda d: d.execute_script(CLICK_CSS_JS, day_css) or d.execute_script(CLICK_XPATH_JS, day_xpath))
         logging.info(f"Selected start date: {start_day}")
 
-        # Wait for and click the Apply button
-        apply_xpath = "//button[.//span[normalize-space(text())='Apply']] | //span[normalize-space(text())='Apply']"
+        # Click the Apply button once it is displayed and enabled
         try:
-            apply_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, apply_xpath))
-            )
-            apply_button.click()
+            wait.until(lambda d: d.execute_script(CLICK_XPATH_JS, APPLY_BUTTON_LOCATOR[1]))
             logging.info("Clicked Apply button.")
         except TimeoutException:
             logging.error("Apply button not found or not clickable.")
@@ -152,58 +230,41 @@ def export_data_to_google_sheets(driver: webdriver.Edge, timeout: int = 20) -> b
         bool: True if export was successful, False otherwise.
     """
     from selenium.webdriver.common.action_chains import ActionChains
-    import time
     try:
-        wait = WebDriverWait(driver, timeout)
+        wait = fast_wait(driver, timeout)
         actions = ActionChains(driver)
 
         # 1. Wait for the first data row to appear (after date selection)
-        data_selector = ".centerColsContainer .row.block-0.index-0"
         logging.info("Waiting for first data row to appear after date selection...")
-        data_element = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, data_selector))
-        )
-        time.sleep(1)  # Small buffer to ensure table is interactive
+        # The row is rendered before its cells are filled in; wait until it shows text so the context menu has data
+        data_element = wait.until(first_data_row_ready)
         actions.context_click(data_element).perform()
         logging.info("Right-clicked first data row to open context menu.")
 
         # 2. Click the Export option in the context menu (by data-test-id)
-        export_option_xpath = "//button[@data-test-id='Export']"
-        export_option = wait.until(
-            EC.element_to_be_clickable((By.XPATH, export_option_xpath))
-        )
+        export_option = wait.until(EC.element_to_be_clickable(EXPORT_OPTION_LOCATOR))
         export_option.click()
         logging.info("Clicked Export option in context menu.")
 
         # 3. Change the export name to 'PumpFuse_new' using the export-name-field class
-        name_input_css = "input.export-name-field"
-        name_input = wait.until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, name_input_css))
-        )
+        name_input = wait.until(EC.visibility_of_element_located(EXPORT_NAME_INPUT_LOCATOR))
         name_input.clear()
         name_input.send_keys("PumpFuse_new")
         logging.info("Changed export name to PumpFuse_new.")
 
         # 4. Select the Google Sheets radio button robustly
         try:
-            # Try to find the label and click the associated input by id
-            label_xpath = "//label[contains(., 'Google Sheets')]"
-            label_elem = wait.until(
-                EC.presence_of_element_located((By.XPATH, label_xpath))
-            )
-            radio_id = label_elem.get_attribute("for")
-            if radio_id:
-                radio_input = driver.find_element(By.ID, radio_id)
-                driver.execute_script("arguments[0].scrollIntoView(true);", radio_input)
-                if not radio_input.is_selected():
-                    radio_input.click()
-                    logging.info("Selected Google Sheets radio button via input id.")
-                else:
-                    logging.info("Google Sheets radio button already selected.")
+            # Try to find the label and click the associated input by id, in one script call
+            label_elem = wait.until(EC.presence_of_element_located(GOOGLE_SHEETS_LABEL_LOCATOR))
+            selected = driver.execute_script(SELECT_LABELLED_RADIO_JS, label_elem)
+            if selected:
+                logging.info("Selected Google Sheets radio button via input id.")
+            elif selected is False:
+                logging.info("Google Sheets radio button already selected.")
             else:
                 # Fallback: click the parent radio button
                 parent_radio = label_elem.find_element(By.XPATH, "ancestor::mat-radio-button")
-                driver.execute_script("arguments[0].scrollIntoView(true);", parent_radio)
+                driver.execute_script(SCROLL_INTO_VIEW_JS, parent_radio)
                 parent_radio.click()
                 logging.info("Selected Google Sheets radio button via parent mat-radio-button.")
         except Exception as e:
@@ -212,11 +273,7 @@ def export_data_to_google_sheets(driver: webdriver.Edge, timeout: int = 20) -> b
 
         # 5. Click the Export button (look for button with span containing 'Export')
         try:
-            export_button_xpath = "//button[.//span[contains(text(),'Export')]]"
-            export_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, export_button_xpath))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", export_button)
+            export_button = wait.until(EC.element_to_be_clickable(EXPORT_BUTTON_LOCATOR))
             export_button.click()
             logging.info("Clicked Export button to complete export.")
         except Exception as e:
@@ -240,44 +297,35 @@ def share_google_sheet_with_service_account(driver: webdriver.Edge, config_path:
     Returns:
         bool: True if sharing was successful, False otherwise.
     """
-    import time
-    config = configparser.ConfigParser()
-    config.read(config_path)
+    config = get_config(config_path)
     email = config.get('google', 'SERVICE_ACCOUNT_USER_EMAIL')
-    wait = WebDriverWait(driver, timeout)
+    wait = fast_wait(driver, timeout)
     try:
-        driver.switch_to.window(driver.window_handles[-1])
-        share_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@role='button' and contains(@aria-label, 'Share')]")))
-        driver.execute_script("arguments[0].scrollIntoView(true);", share_btn)
+        share_btn = wait.until(EC.element_to_be_clickable(SHEET_SHARE_BUTTON_LOCATOR))
         share_btn.click()
         logging.info("Clicked Share button.")
-        time.sleep(2)  # Give dialog time to appear
-
-        # Check for iframe and switch if present
-        iframes = driver.find_elements(By.TAG_NAME, "iframe")
-        for iframe in iframes:
-            try:
-                driver.switch_to.frame(iframe)
-                if driver.find_elements(By.XPATH, "//input[@aria-label='Add people, groups, and calendar events']"):
-                    logging.info("Switched to share dialog iframe.")
-                    break
-                driver.switch_to.default_content()
-            except Exception:
-                driver.switch_to.default_content()
-        else:
-            driver.switch_to.default_content()
-
-        email_input = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@aria-label='Add people, groups, and calendar events']")))
-        driver.execute_script("arguments[0].scrollIntoView(true);", email_input)
+        # Wait for the dialog, switching into its sharing iframe if it is hosted in one
+        in_iframe = wait.until(EC.any_of(
+            EC.frame_to_be_available_and_switch_to_it(SHARE_DIALOG_IFRAME_LOCATOR),
+            EC.presence_of_element_located(SHARE_EMAIL_INPUT_LOCATOR),
+        )) is True
+        if in_iframe:
+            logging.info("Switched to share dialog iframe.")
+
+        email_input = wait.until(EC.presence_of_element_located(SHARE_EMAIL_INPUT_LOCATOR))
         email_input.clear()
         email_input.send_keys(email)
+        wait.until(EC.text_to_be_present_in_element_value(SHARE_EMAIL_INPUT_LOCATOR, email))
         logging.info(f"Entered email: {email}")
-        time.sleep(1)
+        try:
+            fast_wait(driver, SUGGESTION_TIMEOUT).until(
+                EC.visibility_of_element_located(SHARE_SUGGESTION_LOCATOR)
+            )
+        except TimeoutException:
+            logging.info("No address suggestion shown; submitting the typed email.")
         email_input.send_keys(Keys.ENTER)
-        time.sleep(1)
         try:
-            notify_checkbox = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@type='checkbox' and @name='notify']")))
-            driver.execute_script("arguments[0].scrollIntoView(true);", notify_checkbox)
+            notify_checkbox = wait.until(EC.presence_of_element_located(NOTIFY_CHECKBOX_LOCATOR))
             if notify_checkbox.is_selected():
                 notify_checkbox.click()
                 logging.info("Unchecked Notify people checkbox.")
@@ -287,16 +335,14 @@ def share_google_sheet_with_service_account(driver: webdriver.Edge, config_path:
             logging.info("Notify people checkbox not found or already unchecked.")
         # Click the Share or Send button (try Share first, then fallback to Send)
         try:
-            share_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[.//span[text()='Share']]")))
-            driver.execute_script("arguments[0].scrollIntoView(true);", share_button)
+            share_button = wait.until(EC.element_to_be_clickable(DIALOG_SHARE_BUTTON_LOCATOR))
             share_button.click()
             logging.info("Clicked Share button in dialog.")
         except Exception:
-            send_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[.//span[contains(text(),'Send')]]")))
-            driver.execute_script("arguments[0].scrollIntoView(true);", send_btn)
+            send_btn = wait.until(EC.element_to_be_clickable(DIALOG_SEND_BUTTON_LOCATOR))
             send_btn.click()
             logging.info("Clicked Send button in dialog.")
-        wait.until(EC.invisibility_of_element_located((By.XPATH, "//input[@aria-label='Add people, groups, and calendar events']")))
+        wait.until(EC.invisibility_of_element_located(SHARE_EMAIL_INPUT_LOCATOR))
         logging.info(f"Shared Google Sheet with {email} (notify people unchecked).")
         driver.switch_to.default_content()
         return True
@@ -317,15 +363,18 @@ def wait_for_google_sheet_ready(driver: webdriver.Edge, timeout: int = 60) -> bo
         bool: True if the sheet is ready, False otherwise.
     """
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable((By.XPATH, "//div[@role='button' and contains(@aria-label, 'Share')]"))
-        )
+        fast_wait(driver, timeout).until(EC.element_to_be_clickable(SHEET_SHARE_BUTTON_LOCATOR))
         return True
     except Exception as e:
         logging.error(f"Google Sheet did not become ready in time: {e}")
         return False
 
-def switch_to_sheet_tab_by_title(driver: webdriver.Edge, sheet_title: str = "PumpFuse_new", timeout: int = 60) -> bool:
+def switch_to_sheet_tab_by_title(
+    driver: webdriver.Edge,
+    sheet_title: str = "PumpFuse_new",
+    timeout: int = 60,
+    known_handles: Optional[List[str]] = None
+) -> bool:
     """
     Switches to the browser tab whose title contains the given sheet_title.
 
@@ -333,14 +382,18 @@ def switch_to_sheet_tab_by_title(driver: webdriver.Edge, sheet_title: str = "Pum
         driver (webdriver.Edge): Selenium WebDriver instance.
         sheet_title (str): Substring to look for in the tab title.
         timeout (int): Maximum time to wait for the tab to appear (in seconds).
+        known_handles (Optional[List[str]]): Tabs open before the export; only tabs opened since are considered,
+            so a sheet exported by an earlier run in the same browser is not picked.
 
     Returns:
         bool: True if switched successfully, False otherwise.
     """
-    import time
+    known = set(known_handles or [])
     end_time = time.time() + timeout
     while time.time() < end_time:
         for handle in driver.window_handles:
+            if handle in known:
+                continue
             driver.switch_to.window(handle)
             try:
                 if sheet_title.lower() in driver.title.lower():
@@ -350,11 +403,101 @@ def switch_to_sheet_tab_by_title(driver: webdriver.Edge, sheet_title: str = "Pum
         time.sleep(2)
     return False
 
+def edge_debugging_port_open(port: int = EDGE_DEBUGGING_PORT) -> bool:
+    """
+    Checks whether a browser is already listening on the Edge remote debugging port.
+
+    Args:
+        port (int): The remote debugging port to check.
+
+    Returns:
+        bool: True if a connection to the port succeeds, False otherwise.
+    """
+    try:
+        with socket.create_connection((EDGE_DEBUGGING_HOST, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+def start_edge_driver(edge_user_data_dir: str, port: int = EDGE_DEBUGGING_PORT) -> Tuple[webdriver.Edge, bool]:
+    """
+    Attaches to an Edge already running with the remote debugging port, or launches a new one with it open.
+
+    Attaching skips the browser start-up, which is most of the time getlooker.py spends before the report loads.
+
+    Args:
+        edge_user_data_dir (str): Edge user data directory to launch a new browser with.
+        port (int): The remote debugging port to attach to, or to open on a newly launched browser.
+
+    Returns:
+        Tuple[webdriver.Edge, bool]: The driver, and True if it is attached to an already running browser.
+    """
+    if edge_debugging_port_open(port):
+        attach_options = Options()
+        attach_options.add_experimental_option("debuggerAddress", f"{EDGE_DEBUGGING_HOST}:{port}")
+        try:
+            driver = webdriver.Edge(options=attach_options, service=Service(stderr=open(os.devnull, 'w')))
+            logging.info(f"Attached to running Edge on port {port}.")
+            return driver, True
+        except WebDriverException as e:
+            logging.warning(f"Could not attach to Edge on port {port}, launching a new browser: {e}")
+    edge_options = Options()
+    edge_options.add_argument(fr"--user-data-dir={edge_user_data_dir}")
+    edge_options.add_argument("--profile-directory=Default")  # Change if you use a different profile
+    edge_options.add_argument(f"--remote-debugging-port={port}")
+    # Keep the browser running when the driver service stops, so later runs can attach to it
+    edge_options.add_experimental_option("detach", True)
+    # Redirect browser stderr to suppress GPU/Chromium errors
+    edge_service = Service(stderr=open(os.devnull, 'w'))
+    return webdriver.Edge(options=edge_options, service=edge_service), False
+
+def close_tabs_opened_since(driver: webdriver.Edge, known_handles: List[str], keep_handle: str) -> None:
+    """
+    Closes the tabs opened since known_handles were recorded, such as the exported sheet, and switches back to keep_handle.
+
+    Edge stays open between runs, so without this every run would leave another exported sheet tab behind.
+
+    Args:
+        driver (webdriver.Edge): Selenium WebDriver instance.
+        known_handles (List[str]): Tabs open before this run's export, which are left open.
+        keep_handle (str): The tab to leave active, normally the Looker Studio report.
+    """
+    try:
+        for handle in driver.window_handles:
+            if handle not in known_handles and handle != keep_handle:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(keep_handle)
+    except WebDriverException as e:
+        logging.warning(f"Could not close the exported sheet tab: {e}")
+
+def detach_edge_driver(driver: webdriver.Edge) -> None:
+    """
+    Stops the Edge driver service without closing the browser, leaving it open for the next run to attach to.
+
+    driver.quit() would close the browser and its remote debugging port with it.
+
+    Args:
+        driver (webdriver.Edge): Selenium WebDriver instance.
+    """
+    try:
+        driver.service.stop()
+    except Exception as e:
+        logging.debug(f"Suppressed error stopping the Edge driver service: {e}")
+
 if __name__ == "__main__":
     import argparse
     import sys
-    config = configparser.ConfigParser()
-    config.read("config.ini")
+    parser = argparse.ArgumentParser(
+        description="Export new PumpFuse data from Looker Studio to a Google Sheet and share it with the service account."
+    )
+    parser.add_argument(
+        '--attach-port', type=int, default=EDGE_DEBUGGING_PORT,
+        help=f"Edge remote debugging port to attach to, or to open when launching Edge (default {EDGE_DEBUGGING_PORT}). "
+             "A launched Edge is left running with the port open, so the next run attaches to it."
+    )
+    args = parser.parse_args()
+    config = get_config()
     looker_url = config["looker"]["report_url"]
     windows_username = config.get("windows", "username", fallback=None)
     if not windows_username:
@@ -363,39 +506,36 @@ if __name__ == "__main__":
     edge_user_data_dir = fr"C:\\Users\\{windows_username}\\AppData\\Local\\Microsoft\\Edge\\User Data"
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
 
-    # Get latest datetime from Google Sheet
-    latest_dt = get_latest_datetime_from_sheet()
-    if not latest_dt:
-        logging.error("Could not retrieve latest datetime from Google Sheet.")
-        sys.exit(1)
-    start_day = latest_dt.day
-    logging.info(f"Using start day from Google Sheet: {start_day}")
-
     driver: Optional[webdriver.Edge] = None
+    attached = False
+    looker_handle: Optional[str] = None
+    run_start_handles: List[str] = []
     try:
-        from selenium.webdriver.edge.options import Options
-        from selenium.webdriver.edge.service import Service
-        import os
+        from concurrent.futures import ThreadPoolExecutor
         import subprocess
-        edge_options = Options()
-        edge_options.add_argument(fr"--user-data-dir={edge_user_data_dir}")
-        edge_options.add_argument("--profile-directory=Default")  # Change if you use a different profile
-        # Redirect browser stderr to suppress GPU/Chromium errors
-        edge_service = Service(stderr=open(os.devnull, 'w'))
-        driver = webdriver.Edge(options=edge_options, service=edge_service)
-        driver.get(looker_url)
-        logging.info(f"Opened URL: {looker_url}")
-
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "date-text"))
-        )
-
-        if select_looker_date_range(driver, start_day):
+        # Get latest datetime from Google Sheet while the browser starts and loads the report
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            latest_dt_future = executor.submit(get_latest_datetime_from_sheet)
+            driver, attached = start_edge_driver(edge_user_data_dir, args.attach_port)
+            looker_handle = driver.current_window_handle
+            run_start_handles = driver.window_handles
+            driver.get(looker_url)
+            logging.info(f"Opened URL: {looker_url}")
+            latest_dt = latest_dt_future.result()
+        if not latest_dt:
+            logging.error("Could not retrieve latest datetime from Google Sheet.")
+            sys.exit(1)
+        logging.info(f"Using start day from Google Sheet: {latest_dt.day}")
+
+        fast_wait(driver, 20).until(EC.presence_of_element_located(DATE_SELECTOR_LOCATOR))
+
+        if select_looker_date_range(driver, latest_dt):
             logging.info("Date selection completed successfully.")
+            export_handles = driver.window_handles
             if export_data_to_google_sheets(driver):
                 logging.info("Export to Google Sheets completed successfully.")
-                # Switch to the tab with the correct sheet title and share it
-                if switch_to_sheet_tab_by_title(driver, sheet_title="PumpFuse_new"):
+                # Switch to the tab the export opened and share it
+                if switch_to_sheet_tab_by_title(driver, sheet_title="PumpFuse_new", known_handles=export_handles):
                     logging.info("Switched to Google Sheet tab for sharing.")
                     if wait_for_google_sheet_ready(driver, timeout=60):
                         share_google_sheet_with_service_account(driver)
@@ -414,41 +554,9 @@ if __name__ == "__main__":
         logging.error(f"Unexpected error: {e}")
     finally:
         if driver:
-            logging.info("Leaving Looker Studio page open for user inspection. Close the browser window manually when done.")
-            try:
-                while True:
-                    input("Press Ctrl+C in this terminal to close the browser and exit the script...\n")
-            except KeyboardInterrupt:
-                logging.info("User requested shutdown. Closing browser.")
-                try:
-                    # Suppress urllib3 and selenium warnings during shutdown
-                    import logging as pylogging
-                    for noisy_logger in [
-                        'urllib3.connectionpool',
-                        'urllib3.util.retry',
-                        'selenium.webdriver.remote.remote_connection',
-                        'selenium.webdriver.remote.errorhandler',
-                    ]:
-                        pylogging.getLogger(noisy_logger).setLevel(pylogging.ERROR)
-                    driver.quit()
-                except Exception as e:
-                    import traceback
-                    # Suppress expected connection errors on shutdown (e.g., ConnectionResetError, urllib3 warnings)
-                    err_str = str(e)
-                    if any(msg in err_str for msg in [
-                        'ConnectionResetError',
-                        'Failed to establish a new connection',
-                        'actively refused',
-                        'connection was forcibly closed',
-                        'invalid session id',
-                        'invalid after WaitForGetOffsetInRange',
-                        'Retry(total=',
-                        'NewConnectionError',
-                        'MaxRetryError',
-                        'HTTPConnection object',
-                    ]):
-                        logging.debug(f"Suppressed expected shutdown error: {e}")
-                        logging.debug(traceback.format_exc())
-                    else:
-                        logging.error(f"Unexpected error during driver.quit(): {e}")
-                        logging.debug(traceback.format_exc())
\ No newline at end of file
+            # Leave the browser open on the report, whether attached or launched, for the next run to attach to
+            if looker_handle:
+                close_tabs_opened_since(driver, run_start_handles, looker_handle)
+            detach_edge_driver(driver)
+            state = "attached" if attached else "launched"
+            logging.info(f"Leaving the {state} Edge browser open on port {args.attach_port}. Close it manually when done.")
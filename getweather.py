@@ -27,14 +27,46 @@ Logging:
 
 import argparse
 import configparser
+import functools
+import json
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
 import requests
-import gspread
 from gspread.worksheet import Worksheet
-from oauth2client.service_account import ServiceAccountCredentials
+import numpy as np
 import pandas as pd
+from sheets_util import get_gspread_client, with_jitter_retry
+
+COMMON_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Each accepted timestamp shape and the one strptime format that parses it
+TIMESTAMP_PATTERNS = (
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}\s+\d{1,2}:\d{1,2}:\d{1,2}'), COMMON_TIMESTAMP_FORMAT),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}\s+\d{1,2}:\d{1,2}'), '%Y-%m-%d %H:%M'),
+    (re.compile(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{1,2}:\d{1,2}\s+[AaPp][Mm]'), '%b %d, %Y, %I:%M:%S %p'),
+    (re.compile(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{1,2}\s+[AaPp][Mm]'), '%b %d, %Y, %I:%M %p'),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}'), '%Y-%m-%dT%H:%M:%S'),  # ISO 8601 without timezone
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}'), '%Y-%m-%dT%H:%M'),  # ISO 8601 without seconds
+)
+
+CACHE_DIR = '.cache'
+WEATHER_HOURLY_VARS = ('temperature_2m', 'relative_humidity_2m', 'precipitation')
+# Archive data for settled past days does not change; recent days can still be filled in by Open-Meteo
+WEATHER_SETTLED_DAYS = 7
+WEATHER_CACHE_TTL_SECONDS = 30 * 24 * 3600
+WEATHER_RECENT_CACHE_TTL_SECONDS = 3600
+# Timestamps further apart than this are fetched as separate date ranges, concurrently
+WEATHER_CLUSTER_GAP_DAYS = 7
+WEATHER_FETCH_WORKERS = 4
+# Longest date range requested at once; multi-year hourly archives are tens of MB
+WEATHER_MAX_RANGE_DAYS = 366
+
+# Shared so repeated Open-Meteo requests in one run reuse the TLS connection
+WEATHER_SESSION = requests.Session()
 
 # Set up logging
 logging.basicConfig(
@@ -62,14 +94,88 @@ def get_coordinates_from_config(config: configparser.ConfigParser) -> tuple[floa
         raise
 
 
-def get_gspread_client(credentials_path: str) -> gspread.Client:
-    """Authenticate and return a gspread client."""
-    scope = [
-        'https://spreadsheets.google.com/feeds',
-        'https://www.googleapis.com/auth/drive',
-    ]
-    creds = ServiceAccountCredentials.from_json_keyfile_name(credentials_path, scope)
-    return gspread.authorize(creds)
+def weather_url(start: date, end: date, latitude: float, longitude: float) -> str:
+    """Return the Open-Meteo archive request URL for hourly weather over the given days (inclusive)."""
+    return (
+        "https://archive-api.open-meteo.com/v1/archive"
+        f"?latitude={latitude}&longitude={longitude}"
+        f"&start_date={start}&end_date={end}"
+        f"&hourly={','.join(WEATHER_HOURLY_VARS)}"
+        "&timezone=UTC"
+    )
+
+
+def weather_day_cache_path(day: date, latitude: float, longitude: float) -> str:
+    """Return the path of the local cache file for one day of hourly weather at the given location."""
+    return os.path.join(CACHE_DIR, 'weather', f'{latitude}_{longitude}_{day}.json')
+
+
+def read_cached_weather_day(day: date, latitude: float, longitude: float) -> Optional[Dict[str, List[Any]]]:
+    """
+    Return one day of cached hourly weather, or None if it is missing or stale.
+    Days more than WEATHER_SETTLED_DAYS ago are kept for WEATHER_CACHE_TTL_SECONDS, more recent ones
+    only for WEATHER_RECENT_CACHE_TTL_SECONDS so late-arriving archive data is picked up.
+    """
+    path = weather_day_cache_path(day, latitude, longitude)
+    settled = day < (datetime.now(timezone.utc) - timedelta(days=WEATHER_SETTLED_DAYS)).date()
+    ttl = WEATHER_CACHE_TTL_SECONDS if settled else WEATHER_RECENT_CACHE_TTL_SECONDS
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, json.JSONDecodeError) as e:
+        logging.error(f"Ignoring unreadable weather cache {path}: {e}")
+    return None
+
+
+def write_cached_weather_day(day: date, latitude: float, longitude: float, hourly: Dict[str, List[Any]]) -> None:
+    """Save one day of hourly weather to the local cache."""
+    path = weather_day_cache_path(day, latitude, longitude)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(hourly, f)
+    except OSError as e:
+        logging.error(f"Could not save weather cache {path}: {e}")
+
+
+def get_hourly_weather(start: date, end: date, latitude: float, longitude: float) -> Dict[str, List[Any]]:
+    """
+    Return Open-Meteo's hourly arrays ('time' and WEATHER_HOURLY_VARS) for the given days (inclusive).
+    Each day is cached separately, so a run that extends the range by a day only downloads the days not
+    cached yet, in a single request spanning them.
+    """
+    if (end - start).days >= WEATHER_MAX_RANGE_DAYS:
+        raise ValueError(f"Weather range {start} to {end} is longer than {WEATHER_MAX_RANGE_DAYS} days")
+    days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+    by_day = {}
+    missing = []
+    for day in days:
+        cached = read_cached_weather_day(day, latitude, longitude)
+        if cached is None:
+            missing.append(day)
+        else:
+            by_day[day] = cached
+    if missing:
+        response = WEATHER_SESSION.get(weather_url(missing[0], missing[-1], latitude, longitude), timeout=30)
+        response.raise_for_status()
+        hourly = response.json()['hourly']
+        fetched: Dict[date, Dict[str, List[Any]]] = {}
+        for i, ts in enumerate(hourly['time']):
+            # Times are ISO strings such as '2025-06-22T13:00'
+            day_hourly = fetched.setdefault(date.fromisoformat(ts[:10]), {key: [] for key in ('time',) + WEATHER_HOURLY_VARS})
+            for key in day_hourly:
+                day_hourly[key].append(hourly[key][i])
+        for day, day_hourly in fetched.items():
+            write_cached_weather_day(day, latitude, longitude, day_hourly)
+        by_day.update(fetched)
+    result = {key: [] for key in ('time',) + WEATHER_HOURLY_VARS}
+    for day in days:
+        for key, values in by_day.get(day, {}).items():
+            result[key].extend(values)
+    return result
 
 
 def fetch_weather_data(start: datetime, end: datetime, latitude: float, longitude: float) -> pd.DataFrame:
@@ -77,24 +183,16 @@ def fetch_weather_data(start: datetime, end: datetime, latitude: float, longitud
     Fetch hourly weather data from Open-Meteo for the given date range and location.
     Returns a DataFrame indexed by datetime. Temperature is converted to Fahrenheit.
     """
-    url = (
-        "https://archive-api.open-meteo.com/v1/archive"
-        f"?latitude={latitude}&longitude={longitude}"
-        f"&start_date={start.date()}&end_date={end.date()}"
-        "&hourly=temperature_2m,relative_humidity_2m,precipitation"
-        "&timezone=UTC"
-    )
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        times = data['hourly']['time']
-        temp_c = data['hourly']['temperature_2m']
-        temp_f = [(t * 9/5) + 32 if t is not None else None for t in temp_c]
-        rh = data['hourly']['relative_humidity_2m']
-        precip_mm = data['hourly']['precipitation']
+        hourly = get_hourly_weather(start.date(), end.date(), latitude, longitude)
+        times = hourly['time']
+        # Missing (null) values become NaN in the float arrays, which main() writes back as blanks
+        temp_c = np.array(hourly['temperature_2m'], dtype=np.float64)
+        temp_f = temp_c * 9 / 5 + 32
+        rh = hourly['relative_humidity_2m']
+        precip_mm = np.array(hourly['precipitation'], dtype=np.float64)
         # Convert precipitation from mm to inches (1 mm = 0.0393701 in)
-        precip_in = [round(p * 0.0393701, 3) if p is not None else None for p in precip_mm]
+        precip_in = np.round(precip_mm * 0.0393701, 3)
         df = pd.DataFrame({
             'datetime': pd.to_datetime(times),
             'Temperature (F)': temp_f,
@@ -107,52 +205,50 @@ def fetch_weather_data(start: datetime, end: datetime, latitude: float, longitud
         raise
 
 
-def get_sheet_data(ws: Worksheet, start_row: int, end_row: int) -> List[Dict[str, Any]]:
+def split_date_range(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """Split start..end into consecutive ranges covering at most WEATHER_MAX_RANGE_DAYS days each."""
+    ranges = []
+    while (end.date() - start.date()).days >= WEATHER_MAX_RANGE_DAYS:
+        chunk_end = datetime.combine(start.date() + timedelta(days=WEATHER_MAX_RANGE_DAYS - 1), datetime.max.time())
+        ranges.append((start, chunk_end))
+        start = datetime.combine(chunk_end.date() + timedelta(days=1), datetime.min.time())
+    ranges.append((start, end))
+    return ranges
+
+
+def timestamp_clusters(timestamps: pd.DatetimeIndex) -> List[Tuple[datetime, datetime]]:
     """
-    Get records from the worksheet for a specific row range (inclusive).
+    Split the timestamps into (start, end) ranges wherever consecutive timestamps are more than
+    WEATHER_CLUSTER_GAP_DAYS apart, so the days in the gaps are not downloaded. Ranges longer than
+    WEATHER_MAX_RANGE_DAYS are split further.
     """
-    if start_row > end_row:
-        return []
-    # Get headers from the first row
-    headers = ws.row_values(1)
-    # Get data for the specified range. Assuming data is within columns A-Z.
-    # This is more efficient than getting all values.
-    data_range = f'A{start_row}:Z{end_row}'
-    try:
-        data_rows = ws.get(data_range, major_dimension='ROWS')
-    except gspread.exceptions.APIError as e:
-        logging.error(f"Gspread API error fetching range {data_range}: {e}")
-        # Handle case where range is out of bounds of sheet data
-        if "exceeds grid limits" in str(e):
-            # Attempt to get all remaining data from start_row
-            all_sheet_values = ws.get_all_values()
-            if start_row > len(all_sheet_values):
-                return []
-            data_rows = all_sheet_values[start_row-1:end_row]
-        else:
-            raise
-            
-    # Pad rows to header length to avoid missing columns
-    padded_rows = [row + [''] * (len(headers) - len(row)) for row in data_rows]
-    records = [dict(zip(headers, row)) for row in padded_rows]
-    return records
+    ordered = timestamps.sort_values()
+    breaks = np.flatnonzero((ordered[1:] - ordered[:-1]) > pd.Timedelta(days=WEATHER_CLUSTER_GAP_DAYS)) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks - 1, [len(ordered) - 1]))
+    return [
+        date_range
+        for s, e in zip(starts, ends)
+        for date_range in split_date_range(ordered[s].to_pydatetime(), ordered[e].to_pydatetime())
+    ]
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_timestamp(ts: str) -> Optional[datetime]:
     """Try to parse a timestamp string into a datetime object."""
-    formats = [
-        '%Y-%m-%d %H:%M:%S',
-        '%Y-%m-%d %H:%M',
-        '%b %d, %Y, %I:%M:%S %p',
-        '%b %d, %Y, %I:%M %p',
-        '%Y-%m-%dT%H:%M:%S',  # ISO 8601 without timezone
-        '%Y-%m-%dT%H:%M'      # ISO 8601 without seconds
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(ts, fmt)
-        except ValueError:
-            continue
+    try:
+        # Zero-padded ISO timestamps, the most common case, skip the strptime formats
+        return datetime.fromisoformat(ts)
+    except ValueError:
+        pass
+    # Pick the single format the string's shape calls for instead of trying each in turn
+    for pattern, fmt in TIMESTAMP_PATTERNS:
+        if pattern.fullmatch(ts):
+            try:
+                return datetime.strptime(ts, fmt)
+            except ValueError:
+                # Right shape but out-of-range fields; leave it to pandas below
+                break
     # Try pandas to_datetime as a last resort
     try:
         dt = pd.to_datetime(ts, errors='raise')
@@ -165,41 +261,63 @@ def parse_timestamp(ts: str) -> Optional[datetime]:
         return None
 
 
-def ensure_weather_columns(ws: Worksheet, headers: List[str]) -> None:
+def parse_timestamps(values: List[str]) -> pd.DatetimeIndex:
+    """
+    Parse timestamp strings in one vectorized pass, with NaT for those that do not parse.
+    Values not in the most common format are retried one by one with parse_timestamp.
+    """
+    raw = pd.Series(values, dtype=object)
+    parsed = pd.to_datetime(raw, format=COMMON_TIMESTAMP_FORMAT, errors='coerce')
+    retry = parsed.isna() & (raw.str.strip() != '')
+    if retry.any():
+        parsed[retry] = pd.to_datetime(raw[retry].map(parse_timestamp), errors='coerce')
+    return pd.DatetimeIndex(parsed)
+
+
+def ensure_weather_columns(headers: List[str]) -> bool:
     """
-    Ensure the worksheet has correct weather column headers in columns D, E, F; do not insert columns, just update headers if needed.
+    Ensure the headers have the correct weather column names in columns D, E, F; do not insert columns, just rename them if needed.
+    The given headers list is updated in place, and True is returned if the sheet's header row needs writing;
+    update_sheet_with_weather writes it in the same request as the weather data.
     """
     weather_cols = ['Precipitation (in)', 'Temperature (F)', 'Humidity (%)']
     # Only update headers in columns D, E, F (4, 5, 6)
-    headers_updated = False
-    for idx, col in enumerate(weather_cols, start=4):
-        if len(headers) < idx:
-            # If headers are too short, pad them
-            headers += [''] * (idx - len(headers) + 1)
-        if headers[idx-1] != col:
-            ws.update_cell(1, idx, col)
-            headers_updated = True
-            logging.info(f"Set weather column header: {col} at position {idx}")
-    if headers_updated:
-        logging.info("Weather column headers updated in columns D-F.")
+    if headers[3:6] == weather_cols:
+        return False
+    if len(headers) < 6:
+        # If headers are too short, pad them
+        headers += [''] * (6 - len(headers))
+    headers[3:6] = weather_cols
+    return True
 
 
-def update_sheet_with_weather(ws: Worksheet, start_row: int, weather_results: List[Dict[str, Any]], headers: List[str]) -> None:
+def update_sheet_with_weather(ws: Worksheet, start_row: int, weather_results: List[Dict[str, Any]], headers: List[str], headers_updated: bool = False) -> None:
     """
     Batch update the worksheet with weather data starting at the given row.
-    Precipitation (mm) in E, Temperature (F) in F, Humidity (%) in G.
+    Precipitation (in) in D, Temperature (F) in E, Humidity (%) in F.
+    If headers_updated, the weather column headers in D1:F1 are written in the same batch request.
     """
-    # Prepare a 2D list for columns E, F, G
-    values = [
-        [w['Precipitation (in)'], w['Temperature (F)'], w['Humidity (%)']]
-        for w in weather_results
-    ]
-    end_row = start_row + len(values) - 1
+    data = []
+    if headers_updated:
+        data.append({'range': 'D1:F1', 'values': [headers[3:6]]})
+    if weather_results:
+        # Prepare a 2D list for columns D, E, F
+        values = [
+            [w['Precipitation (in)'], w['Temperature (F)'], w['Humidity (%)']]
+            for w in weather_results
+        ]
+        end_row = start_row + len(values) - 1
+        data.append({'range': f'D{start_row}:F{end_row}', 'values': values})
+    if not data:
+        return
+    ranges = ', '.join(d['range'] for d in data)
     try:
-        ws.update(values, f'D{start_row}:F{end_row}')
-        logging.info(f"Batch updated weather data in range D{start_row}:F{end_row}")
+        with_jitter_retry(ws.batch_update, data, value_input_option='RAW')
+        if headers_updated:
+            logging.info("Weather column headers updated in columns D-F.")
+        logging.info(f"Batch updated weather data in range {ranges}")
     except Exception as e:
-        logging.error(f"Batch update failed for range D{start_row}:F{end_row}: {e}")
+        logging.error(f"Batch update failed for range {ranges}: {e}")
 
 
 def main() -> None:
@@ -219,17 +337,24 @@ def main() -> None:
 
         credentials_path = config['google']['credentials_json']
         target_sheet_name = config['google']['target_sheet_name']
+        target_sheet_id = config['google'].get('target_sheet_id')
         latitude, longitude = get_coordinates_from_config(config)
 
         client = get_gspread_client(credentials_path)
-        sh = client.open(target_sheet_name)
-        ws = sh.worksheet('Data')
+        # Opening by key skips the Drive search by name
+        if target_sheet_id:
+            sh = with_jitter_retry(client.open_by_key, target_sheet_id)
+        else:
+            sh = with_jitter_retry(client.open, target_sheet_name)
+        ws = with_jitter_retry(sh.worksheet, 'Data')
 
-        all_values = ws.get_all_values()
-        headers = all_values[0]
-        ensure_weather_columns(ws, headers)
-        # Refresh headers in case columns were added
-        headers = ws.get_all_values()[0]
+        # Only columns A-F (blank, Timestamp, Delta and the weather columns) are used below the header row,
+        # so download those instead of the whole sheet
+        header_range, data_range = with_jitter_retry(ws.batch_get, ['1:1', 'A2:F'])
+        headers = list(header_range[0]) if header_range else []
+        all_values = [headers] + [list(row) for row in data_range]
+        # Updates headers in place if the weather columns were renamed; the header row is written with the data
+        headers_updated = ensure_weather_columns(headers)
 
         # Determine start_row and end_row if not provided
         start_row = args.start_row
@@ -256,70 +381,59 @@ def main() -> None:
             if start_row_candidate is None:
                 print("No rows require weather data. Nothing to do.")
                 logging.info("No rows require weather data.")
+                update_sheet_with_weather(ws, 2, [], headers, headers_updated)
                 return
             start_row = start_row_candidate
 
 
-        # Determine the last row to process by finding the last row with a valid timestamp in column 'Timestamp'
-        data_rows = all_values[start_row-1:]
-        last_valid_row = None
-        for idx, row in enumerate(data_rows, start=start_row):
-            # Pad to at least 3 columns for timestamp
-            padded = row + [''] * (3 - len(row))
-            ts_val = padded[1].strip() if len(padded) > 1 else ''  # Column B is 'Timestamp'
-            if parse_timestamp(ts_val):
-                last_valid_row = idx
-        if last_valid_row is None or last_valid_row < start_row:
-            print("No new rows to process.")
-            logging.info(f"No new rows to process from start_row {start_row}.")
-            return
-        # Get records from start_row to last_valid_row (inclusive)
-        records = get_sheet_data(ws, start_row, last_valid_row)
-        if not records:
+        # Parse column B ('Timestamp') once for every row from start_row down. The result gives the last row to
+        # process (the last one with a valid timestamp), the date range to fetch weather for, and the timestamps
+        # to match weather against, so no timestamp is parsed twice.
+        ts_column = [row[1].strip() if len(row) > 1 else '' for row in all_values[start_row-1:]]
+        column_timestamps = parse_timestamps(ts_column)
+        valid_positions = np.flatnonzero(column_timestamps.notna())
+        if len(valid_positions) == 0:
             print("No new rows to process.")
             logging.info(f"No new rows to process from start_row {start_row}.")
+            update_sheet_with_weather(ws, start_row, [], headers, headers_updated)
             return
-        # Gather all valid timestamps for weather data fetch range
-        timestamps = [parse_timestamp(r.get('Timestamp', '')) for r in records]
-        valid_timestamps = [t for t in timestamps if t is not None]
-        if not valid_timestamps:
-            logging.error("No valid timestamps found in the specified rows.")
-            print("No valid timestamps found.")
-            return
-
-        start_dt = min(valid_timestamps)
-        end_dt = max(valid_timestamps)
-        weather_df = fetch_weather_data(start_dt, end_dt, latitude, longitude)
-
-        import math
-        def clean_value(val):
+        last_valid_row = start_row + int(valid_positions[-1])
+        timestamps = column_timestamps[:valid_positions[-1] + 1]
+        valid = timestamps.notna()
+        valid_timestamps = timestamps[valid]
+        date_ranges = timestamp_clusters(valid_timestamps)
+
+        with ThreadPoolExecutor(max_workers=min(WEATHER_FETCH_WORKERS, len(date_ranges))) as executor:
+            # Fetch weather from Open-Meteo for each date range concurrently
+            weather_futures = [
+                executor.submit(fetch_weather_data, start_dt, end_dt, latitude, longitude)
+                for start_dt, end_dt in date_ranges
+            ]
+            weather_df = pd.concat([future.result() for future in weather_futures]).sort_index()
+
+        weather_cols = ['Precipitation (in)', 'Temperature (F)', 'Humidity (%)']
+        empty_weather = dict.fromkeys(weather_cols)
+        try:
+            # Match every parsed timestamp to its nearest hour in one pass
+            matched = weather_df.reindex(valid_timestamps, method='nearest')[weather_cols]
             # Convert NaN, inf, -inf to None for Google Sheets compatibility
-            if val is None:
-                return None
-            if isinstance(val, float) and (math.isnan(val) or math.isinf(val)):
-                return None
-            return val
+            matched = matched.replace([np.inf, -np.inf], np.nan).astype(object)
+            matched_records = matched.where(matched.notna(), None).to_dict('records')
+        except Exception as e:
+            logging.error(f"Failed to match weather for rows {start_row} to {last_valid_row}: {e}")
+            matched_records = [empty_weather] * len(valid_timestamps)
 
         weather_results = []
-        for idx, r in enumerate(records):
-            ts = parse_timestamp(r.get('Timestamp', ''))
-            if ts is None:
-                logging.info(f"Skipping row {start_row + idx}: unparseable timestamp '{r.get('Timestamp', '')}'")
-                weather_results.append({'Precipitation (in)': None, 'Temperature (F)': None, 'Humidity (%)': None})
-                continue
-            try:
-                nearest = weather_df.index.get_indexer([ts], method='nearest')[0]
-                weather_row = weather_df.iloc[nearest]
-                weather_results.append({
-                    'Precipitation (in)': clean_value(weather_row['Precipitation (in)']),
-                    'Temperature (F)': clean_value(weather_row['Temperature (F)']),
-                    'Humidity (%)': clean_value(weather_row['Humidity (%)'])
-                })
-            except Exception as e:
-                logging.error(f"Failed to match weather for row {start_row + idx}: {e}")
-                weather_results.append({'Precipitation (in)': None, 'Temperature (F)': None, 'Humidity (%)': None})
-
-        update_sheet_with_weather(ws, start_row, weather_results, headers)
+        matched_iter = iter(matched_records)
+        # Rows start_row to last_valid_row (inclusive), by position in the Timestamp column
+        for idx, (ts_val, is_valid) in enumerate(zip(ts_column, valid)):
+            if is_valid:
+                weather_results.append(next(matched_iter))
+            else:
+                logging.info(f"Skipping row {start_row + idx}: unparseable timestamp '{ts_val}'")
+                weather_results.append(empty_weather)
+
+        update_sheet_with_weather(ws, start_row, weather_results, headers, headers_updated)
         print(f"Weather data added to rows {start_row} to {start_row + len(weather_results) - 1}.")
 
     except KeyboardInterrupt:
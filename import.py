@@ -35,14 +35,36 @@ Exception Handling:
 
 import argparse
 import configparser
+import functools
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, List, Optional
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 import pytz
-import gspread
+import numpy as np
+import pandas as pd
 from gspread.worksheet import Worksheet
-from oauth2client.service_account import ServiceAccountCredentials
 import re
+from sheets_util import get_gspread_client, with_jitter_retry
+
+EASTERN_TZ = pytz.timezone('US/Eastern')
+PACIFIC_TZ = pytz.timezone('US/Pacific')
+# Accepted timestamp formats, including 'Jun 22, 2025, 1:45:08 PM'
+TIMESTAMP_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%b %d, %Y, %I:%M:%S %p',
+    '%b %d, %Y, %I:%M %p'
+)
+# Layout of the target sheet's Data tab; column A has a blank header
+TARGET_HEADERS = ['', 'Timestamp', 'Delta']
+# Zero-padded or not, the shape of the first two TIMESTAMP_FORMATS
+FAST_TIMESTAMP_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{1,2})(?::(\d{1,2}))?')
+# A1 cell reference such as 'B12', split into column letters and row number
+CELL_REF_PATTERN = re.compile(r'([A-Z]+)(\d+)')
+# The Time column last written by update_time_column, so a repeated run does not convert it twice
+CONVERTED_CACHE_PATH = os.path.join('.cache', 'converted_times.json')
 
 # Set up logging
 logging.basicConfig(
@@ -52,153 +74,218 @@ logging.basicConfig(
 )
 
 
+_CONFIG_CACHE: Dict[str, Tuple[Optional[float], configparser.ConfigParser]] = {}
+
 def load_config(config_path: str = 'config.ini') -> configparser.ConfigParser:
-    """Load configuration from the given .ini file."""
+    """Load configuration from the given .ini file, re-reading it only if it has changed since the last load."""
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        mtime = None  # ConfigParser.read() skips missing files, so cache the empty config too
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
     config = configparser.ConfigParser()
     config.read(config_path)
+    _CONFIG_CACHE[config_path] = (mtime, config)
     return config
 
 
-def get_gspread_client(credentials_path: str) -> gspread.Client:
-    """Authenticate and return a gspread client."""
-    scope = [
-        'https://spreadsheets.google.com/feeds',
-        'https://www.googleapis.com/auth/drive',
-    ]
-    creds = ServiceAccountCredentials.from_json_keyfile_name(credentials_path, scope)
-    return gspread.authorize(creds)
-
-
+@functools.lru_cache(maxsize=None)
+def column_letter(col: int) -> str:
+    """Return the A1 column letters for a 1-based column number, e.g. 1 -> 'A', 27 -> 'AA'."""
+    letters = ''
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(ts: str) -> Optional[datetime]:
+    """Parse a timestamp string in any of TIMESTAMP_FORMATS, or return None if it matches none of them."""
+    # Zero-padded 'YYYY-mm-dd HH:MM[:SS]' timestamps, the most common case, are parsed in C; the length and
+    # separator checks keep out the other ISO forms fromisoformat accepts but TIMESTAMP_FORMATS do not
+    if len(ts) in (16, 19) and ts[10] == ' ' and ts[13] == ':' and ts[16:17] in ('', ':'):
+        try:
+            dt = datetime.fromisoformat(ts)
+            if dt.tzinfo is None:
+                return dt
+        except ValueError:
+            pass
+    # Unpadded ones are built straight from the regex groups
+    match = FAST_TIMESTAMP_PATTERN.fullmatch(ts)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second or 0))
+        except ValueError:
+            pass
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(ts, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
 def convert_time_eastern_to_pacific(time_str: str) -> Optional[str]:
     """Convert a time string from US Eastern to US Pacific, rounding to nearest minute, formatted as 'YYYY-mm-dd h:m:00'."""
     try:
-        eastern = pytz.timezone('US/Eastern')
-        pacific = pytz.timezone('US/Pacific')
-        # Try parsing with various formats, including 'Jun 22, 2025, 1:45:08 PM'
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%b %d, %Y, %I:%M:%S %p',
-            '%b %d, %Y, %I:%M %p'
-        ]
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(time_str, fmt)
-                break
-            except ValueError:
-                continue
-        else:
+        dt = parse_timestamp(time_str)
+        if dt is None:
             logging.error(f"Unrecognized time format: {time_str}")
             return None
-        dt_eastern = eastern.localize(dt)
-        dt_pacific = dt_eastern.astimezone(pacific)
-        # Round to nearest minute
-        if dt_pacific.second >= 30:
-            dt_pacific = dt_pacific.replace(second=0) + timedelta(minutes=1)
-        else:
-            dt_pacific = dt_pacific.replace(second=0)
+        dt_eastern = EASTERN_TZ.localize(dt)
+        # Round to nearest minute on the epoch seconds, then convert to Pacific
+        epoch = (int(dt_eastern.timestamp()) + 30) // 60 * 60
+        dt_pacific = datetime.fromtimestamp(epoch, tz=PACIFIC_TZ)
         # Format: YYYY-mm-dd h:m:00 (no leading zero for hour, cross-platform)
-        formatted = dt_pacific.strftime('%Y-%m-%d %H:%M:00')
-        # Remove leading zero from hour if present
-        formatted = formatted.replace(' 0', ' ')
-        return formatted
+        return f"{dt_pacific.year:04d}-{dt_pacific.month:02d}-{dt_pacific.day:02d} {dt_pacific.hour}:{dt_pacific.minute:02d}:00"
     except Exception as e:
         logging.error(f"Error converting time '{time_str}': {e}")
         return None
 
 
-def get_most_recent_timestamp(ws: Worksheet, timestamp_col: str = 'Timestamp', expected_headers: Optional[List[str]] = None) -> Optional[datetime]:
+def convert_times_eastern_to_pacific(time_strs: List[str]) -> List[Optional[str]]:
+    """
+    Convert a column of time strings like convert_time_eastern_to_pacific, in one vectorized pandas pass.
+    Values pandas cannot parse in any of TIMESTAMP_FORMATS are retried one by one with convert_time_eastern_to_pacific.
+    """
+    raw = pd.Series(time_strs, dtype=object)
+    parsed = pd.Series(pd.NaT, index=raw.index, dtype='datetime64[ns]')
+    for fmt in TIMESTAMP_FORMATS:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(raw[missing], format=fmt, errors='coerce')
+    # Like pytz's localize(), take standard time for ambiguous times and the pre-transition offset for skipped ones
+    eastern = parsed.dt.tz_localize(EASTERN_TZ, ambiguous=np.zeros(len(parsed), dtype=bool), nonexistent=pd.Timedelta(hours=1))
+    # Round half up to the nearest minute in UTC, where flooring never lands on an ambiguous local time
+    rounded = (eastern.dt.tz_convert('UTC') + pd.Timedelta(seconds=30)).dt.floor('min')
+    pacific = rounded.dt.tz_convert(PACIFIC_TZ)
+    # Format: YYYY-mm-dd h:m:00 (no leading zero for hour)
+    formatted = pacific.dt.strftime('%Y-%m-%d %H:%M:00').str.replace(' 0', ' ', regex=False)
+    return [
+        value if isinstance(value, str) else convert_time_eastern_to_pacific(time_str)
+        for value, time_str in zip(formatted.tolist(), time_strs)
+    ]
+
+
+def get_most_recent_timestamp(ws: Worksheet, timestamp_col: str = 'Timestamp', expected_headers: Optional[List[str]] = None) -> Tuple[Optional[datetime], Optional[int]]:
     """
-    Get the most recent datetime from the given worksheet's timestamp column.
+    Get the most recent datetime from the given worksheet's timestamp column, and the 1-based row number it is in.
     Handles duplicate headers gracefully. Allows a single empty header if present, as in the case of a blank column A.
     Optionally accepts expected_headers to override worksheet headers.
+    Only the timestamp column is downloaded, and since rows are appended in chronological order it is scanned
+    from the bottom up, stopping at the first parseable timestamp.
     """
     try:
-        if expected_headers:
-            records = ws.get_all_records(expected_headers=expected_headers)
-            headers = expected_headers
-        else:
-            records = ws.get_all_records()
-            headers = list(records[0].keys()) if records else []
+        headers = expected_headers if expected_headers else with_jitter_retry(ws.row_values, 1)
         # Check for duplicate headers (allow a single empty string)
-        header_counts = {}
-        for h in headers:
-            header_counts[h] = header_counts.get(h, 0) + 1
-        duplicates = [k for k, v in header_counts.items() if v > 1]
-        if duplicates:
+        if len(set(headers)) != len(headers):
             logging.error(f"Header row contains duplicate values: {headers}")
-            return None
-        timestamps = [r[timestamp_col] for r in records if r.get(timestamp_col)]
-        # Try parsing all timestamps
-        dt_list = []
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%b %d, %Y, %I:%M:%S %p',
-            '%b %d, %Y, %I:%M %p'
-        ]
-        for t in timestamps:
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(t, fmt)
-                    dt_list.append(dt)
-                    break
-                except ValueError:
-                    continue
-        if not dt_list:
-            return None
-        return max(dt_list)
+            return None, None
+        if timestamp_col not in headers:
+            logging.error(f"No '{timestamp_col}' column found in headers: {headers}")
+            return None, None
+        timestamps = with_jitter_retry(ws.col_values, headers.index(timestamp_col) + 1)[1:]
+        for row_number in range(len(timestamps) + 1, 1, -1):  # Data starts at row 2
+            t = timestamps[row_number - 2]
+            if t:
+                dt = parse_timestamp(t)
+                if dt:
+                    return dt, row_number
+        return None, None
     except Exception as e:
         logging.error(f"Error finding most recent timestamp: {e}")
-        return None
+        return None, None
+
+
+def times_already_converted(sheet_key: str, times: List[Any]) -> bool:
+    """
+    Return True if times are the Time column update_time_column last wrote to this sheet, or its bottom rows.
+    Converted and raw Eastern times can have the same shape, so this compares against what was written
+    instead of inspecting the values; rows deleted from the top since then still count as converted.
+    """
+    try:
+        with open(CONVERTED_CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('sheet') != sheet_key:
+            return False
+        written = cache['times']
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, KeyError, AttributeError) as e:
+        logging.error(f"Ignoring unreadable converted-times cache {CONVERTED_CACHE_PATH}: {e}")
+        return False
+    return 0 < len(times) <= len(written) and written[len(written) - len(times):] == times
+
+
+def write_converted_times(sheet_key: str, times: List[Any]) -> None:
+    """Record the Time column just written to this sheet."""
+    try:
+        os.makedirs(os.path.dirname(CONVERTED_CACHE_PATH), exist_ok=True)
+        with open(CONVERTED_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'sheet': sheet_key, 'times': times}, f)
+    except OSError as e:
+        logging.error(f"Could not write converted-times cache {CONVERTED_CACHE_PATH}: {e}")
 
 
 def update_time_column(input_ws: Worksheet, time_col: str, input_records: List[dict]) -> None:
     """
     Batch update the Time column in the input worksheet, converting from Eastern to Pacific.
+    input_records is updated in place to match the sheet, so it can be reused instead of re-fetched.
+    A column this function already converted, in a run that stopped before moving the rows, is left unchanged.
     """
     try:
+        sheet_key = f"{input_ws.spreadsheet.id}:{input_ws.id}:{time_col}"
+        orig_times = [r[time_col] for r in input_records]
+        if times_already_converted(sheet_key, orig_times):
+            logging.info("Time column was already converted by an earlier run; leaving it unchanged.")
+            return
         col_idx = list(input_records[0].keys()).index(time_col) + 1
-        cell_list = input_ws.range(2, col_idx, len(input_records) + 1, col_idx)
-        for i, cell in enumerate(cell_list):
-            orig_time = input_records[i][time_col]
-            new_time = convert_time_eastern_to_pacific(orig_time)
-            if new_time:
-                cell.value = new_time
-        input_ws.update_cells(cell_list)
+        col_letter = column_letter(col_idx)
+        # One column of plain values; times that cannot be converted are written back unchanged
+        values = [[new_time or orig_time] for new_time, orig_time in zip(convert_times_eastern_to_pacific(orig_times), orig_times)]
+        range_name = f'{col_letter}2:{col_letter}{len(values) + 1}'
+        with_jitter_retry(input_ws.update, range_name=range_name, values=values, value_input_option='RAW')
+        for r, (new_time,) in zip(input_records, values):
+            r[time_col] = new_time
+        write_converted_times(sheet_key, [new_time for new_time, in values])
         logging.info("Time column updated successfully.")
     except Exception as e:
         logging.error(f"Failed to update Time column: {e}")
         raise
 
 
-def delete_rows_up_to_datetime(input_ws: Worksheet, time_col: str, most_recent: datetime) -> None:
+def delete_rows_up_to_datetime(input_ws: Worksheet, time_col: str, most_recent: datetime, input_records: Optional[List[dict]] = None) -> List[dict]:
     """
     Delete all rows in the input worksheet up to and including the row with the most recent datetime.
+    Uses input_records if given instead of fetching them, and returns the records of the rows left in the sheet.
     """
     try:
-        input_records = input_ws.get_all_records()
+        if input_records is None:
+            # Only the time column is needed, so skip downloading the rest of the sheet
+            time_col_idx = with_jitter_retry(input_ws.row_values, 1).index(time_col) + 1
+            input_records = [{time_col: value} for value in with_jitter_retry(input_ws.col_values, time_col_idx)[1:]]
+        # Rows are in chronological order, so stop parsing at the first time after most_recent
         del_idx = None
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%b %d, %Y, %I:%M:%S %p",
-            "%b %d, %Y, %I:%M %p"
-        ]
         for i, row in enumerate(input_records):
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(row[time_col], fmt)
-                    if dt <= most_recent:
-                        del_idx = i
-                    break
-                except Exception:
-                    continue
+            value = row[time_col]
+            dt = parse_timestamp(value) if isinstance(value, str) else None
+            if dt is None:
+                continue
+            if dt > most_recent:
+                break
+            del_idx = i
         if del_idx is not None:
-            input_ws.delete_rows(2, del_idx + 2)
+            with_jitter_retry(input_ws.delete_rows, 2, del_idx + 2)
             logging.info(f"Deleted rows 2 to {del_idx + 2} in input sheet.")
-        else:
-            logging.info("No rows to delete based on most recent timestamp.")
+            return input_records[del_idx + 1:]
+        logging.info("No rows to delete based on most recent timestamp.")
+        return input_records
     except Exception as e:
         logging.error(f"Failed to delete rows: {e}")
         raise
@@ -209,82 +296,81 @@ def append_timestamps_and_extend_formula(
     target_ws: Worksheet,
     input_time_col: str = 'Time',
     target_timestamp_col: str = 'Timestamp',
-    expected_headers: Optional[List[str]] = None
+    expected_headers: Optional[List[str]] = None,
+    input_records: Optional[List[dict]] = None
 ) -> None:
     """
     Append time data from input_ws (input_time_col) to target_ws (target_timestamp_col) after the last timestamp entry.
-    Extend the Delta formula for all added rows. Uses batch update to minimize API calls.
+    Extend the Delta formula for all added rows. Uses a single update call to minimize API calls.
     Dynamically increments row numbers in the formula for each new row.
+    Uses input_records if given instead of fetching them from input_ws.
     """
     try:
         # Get input times
-        input_records = input_ws.get_all_records()
-        times = [r[input_time_col] for r in input_records if r.get(input_time_col)]
+        if input_records is None:
+            time_col_idx = with_jitter_retry(input_ws.row_values, 1).index(input_time_col) + 1
+            times = [value for value in with_jitter_retry(input_ws.col_values, time_col_idx)[1:] if value]
+        else:
+            times = [r[input_time_col] for r in input_records if r.get(input_time_col)]
         num_to_add = len(times)
         if num_to_add == 0:
             logging.info("No times to append from input sheet.")
             return
 
-        # Get target records and find last row with a timestamp
+        # Get target headers
         if expected_headers:
             headers = expected_headers
-            target_records = target_ws.get_all_records(expected_headers=expected_headers)
             num_cols = len(expected_headers)
         else:
-            headers = target_ws.row_values(1)
+            headers = with_jitter_retry(target_ws.row_values, 1)
             if not headers:
                 logging.warning("Target sheet has no headers, cannot proceed.")
                 return
-            target_records = target_ws.get_all_records()
             num_cols = len(headers)
 
-        last_row_idx = 1  # 1-based, header is row 1
-        for i, row in enumerate(target_records, start=2):
-            if row.get(target_timestamp_col):
-                last_row_idx = i
-        
-        # Insert new rows after last timestamp row, with correct number of columns
-        empty_row = [''] * num_cols
-        if num_to_add > 0:
-            target_ws.insert_rows([empty_row for _ in range(num_to_add)], row=last_row_idx + 1)
-        
         # Prepare batch update for timestamps and formulas
         timestamp_col_idx = headers.index(target_timestamp_col)
         delta_col_idx = headers.index('Delta')
-        
+
+        # Read the Timestamp and Delta columns in one request. Formulas are needed from the Delta column, and
+        # with FORMULA rendering a filled Timestamp cell is still non-empty, which is all that is checked here.
+        timestamp_col_letter = column_letter(timestamp_col_idx + 1)
+        delta_col_letter = column_letter(delta_col_idx + 1)
+        timestamp_values, delta_values = with_jitter_retry(
+            target_ws.batch_get,
+            [f'{timestamp_col_letter}2:{timestamp_col_letter}', f'{delta_col_letter}2:{delta_col_letter}'],
+            value_render_option='FORMULA'
+        )
+
+        # Find last row with a timestamp, searching backwards
+        last_row_idx = 1  # 1-based, header is row 1
+        for i in range(len(timestamp_values) - 1, -1, -1):
+            if timestamp_values[i] and timestamp_values[i][0]:
+                last_row_idx = i + 2
+                break
+
         # Get the formula from the last row with a Delta formula by searching backwards
         formula = None
         formula_base_row = 0
-        for i in range(last_row_idx, 1, -1):
-            try:
-                cell = target_ws.cell(i, delta_col_idx + 1, value_render_option='FORMULA')
-                if cell.value and str(cell.value).startswith('='):
-                    formula = cell.value
-                    formula_base_row = i
-                    break
-            except Exception as e:
-                logging.debug(f"Could not fetch cell ({i}, {delta_col_idx + 1}): {e}")
-                continue # Ignore errors for cells that can't be fetched
+        for i in range(min(len(delta_values), last_row_idx - 1) - 1, -1, -1):
+            value = delta_values[i][0] if delta_values[i] else None
+            if value and str(value).startswith('='):
+                formula = value
+                formula_base_row = i + 2
+                break
         
         logging.info(f"Using formula from row {formula_base_row}: {formula}")
 
         # Build new rows data
         new_rows = []
         if formula:
-            def get_new_formula(original_formula, base_row, current_row):
-                offset = current_row - base_row
-                def increment_row_references(match):
-                    col = match.group(1)
-                    row = int(match.group(2))
-                    return f"{col}{row + offset}"
-                return re.sub(r'([A-Z]+)(\d+)', increment_row_references, original_formula)
-
             for i, ts in enumerate(times):
                 row = [''] * num_cols
                 row[timestamp_col_idx] = ts
                 new_row_num = last_row_idx + 1 + i
-                new_formula = get_new_formula(formula, formula_base_row, new_row_num)
-                row[delta_col_idx] = new_formula
+                # Shift every cell reference in the formula down to the new row
+                offset = new_row_num - formula_base_row
+                row[delta_col_idx] = CELL_REF_PATTERN.sub(lambda m: f"{m.group(1)}{int(m.group(2)) + offset}", formula)
                 new_rows.append(row)
         else:
             logging.warning("No formula found to extend.")
@@ -293,19 +379,16 @@ def append_timestamps_and_extend_formula(
                 row[timestamp_col_idx] = ts
                 new_rows.append(row)
 
-        # Batch update all new rows with correct argument order
+        # Write all new rows to the explicit range after the last timestamp row in one call, growing the
+        # grid first if it is too short. An explicit range does not depend on the Sheets table detection
+        # that append calls use, which can misplace rows when column A is blank.
         if new_rows:
             start_row = last_row_idx + 1
-            end_row = start_row + num_to_add - 1
-            
-            end_col_char = ''
-            n = num_cols
-            while n > 0:
-                n, remainder = divmod(n - 1, 26)
-                end_col_char = chr(65 + remainder) + end_col_char
-            
-            range_name = f'A{start_row}:{end_col_char}{end_row}'
-            target_ws.update(range_name=range_name, values=new_rows, value_input_option='USER_ENTERED')
+            end_row = last_row_idx + num_to_add
+            if target_ws.row_count < end_row:
+                with_jitter_retry(target_ws.add_rows, end_row - target_ws.row_count)
+            range_name = f'A{start_row}:{column_letter(num_cols)}{end_row}'
+            with_jitter_retry(target_ws.update, range_name=range_name, values=new_rows, value_input_option='USER_ENTERED')
         logging.info(f"Appended {num_to_add} times from input sheet and extended Delta formula (batch update).")
     except Exception as e:
         logging.error(f"Failed to append times and extend formula: {e}")
@@ -329,15 +412,15 @@ def main() -> None:
         client = get_gspread_client(credentials_path)
 
         # Open input spreadsheet and its Sheet1 tab
-        input_sh = client.open(input_sheet_name)
-        input_ws = input_sh.worksheet('Sheet1')
+        input_sh = with_jitter_retry(client.open, input_sheet_name)
+        input_ws = with_jitter_retry(input_sh.worksheet, 'Sheet1')
 
         # Open target spreadsheet and its Data tab
-        target_sh = client.open(target_sheet_name)
-        target_ws = target_sh.worksheet('Data')
+        target_sh = with_jitter_retry(client.open, target_sheet_name)
+        target_ws = with_jitter_retry(target_sh.worksheet, 'Data')
 
         # Get all records from input sheet
-        input_records = input_ws.get_all_records()
+        input_records = with_jitter_retry(input_ws.get_all_records)
         if not input_records:
             logging.info("No records found in input sheet.")
             return
@@ -356,43 +439,16 @@ def main() -> None:
         update_time_column(input_ws, time_col, input_records)
 
         # Find most recent timestamp in target sheet, using explicit headers for blank column A
-        expected_headers = ['', 'Timestamp', 'Delta']
-        most_recent = get_most_recent_timestamp(target_ws, timestamp_col='Timestamp', expected_headers=expected_headers)
+        most_recent, row_number = get_most_recent_timestamp(target_ws, timestamp_col='Timestamp', expected_headers=TARGET_HEADERS)
         if not most_recent:
             logging.info("No valid timestamps found in target sheet.")
             return
 
         # Print the latest datetime value and its associated row number before importing data
-        # Find the row number for the most recent timestamp
-        target_records = target_ws.get_all_records(expected_headers=expected_headers)
-        row_number = None
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%b %d, %Y, %I:%M:%S %p',
-            '%b %d, %Y, %I:%M %p'
-        ]
-        for idx, row in enumerate(target_records, start=2):  # Data starts at row 2
-            ts = row.get('Timestamp')
-            if not ts:
-                continue
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(ts, fmt)
-                    if dt == most_recent:
-                        row_number = idx
-                        break
-                except Exception:
-                    continue
-            if row_number is not None:
-                break
         print(f"Latest datetime in 'Timestamp' column: {most_recent} (row {row_number})")
 
-        # Re-fetch input records after update
-        input_records = input_ws.get_all_records()
-
         # Delete rows up to and including most recent datetime in input sheet
-        delete_rows_up_to_datetime(input_ws, time_col, most_recent)
+        input_records = delete_rows_up_to_datetime(input_ws, time_col, most_recent, input_records)
 
         # Append times and extend Delta formula in target sheet
         append_timestamps_and_extend_formula(
@@ -400,7 +456,8 @@ def main() -> None:
             target_ws,
             input_time_col=time_col,  # usually 'Time'
             target_timestamp_col='Timestamp',
-            expected_headers=['', 'Timestamp', 'Delta']
+            expected_headers=TARGET_HEADERS,
+            input_records=input_records
         )
     except KeyboardInterrupt:
         logging.info("Process interrupted by user.")
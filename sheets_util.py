@@ -0,0 +1,189 @@
+"""
+sheets_util.py
+
+Google Sheets helpers shared by getdate.py, getlooker.py, import.py and getweather.py.
+
+- Authorizes one gspread client per service account key file.
+- Retries rate-limited (HTTP 429) Sheets API calls with full-jitter exponential backoff.
+- Parses the accepted Timestamp formats and finds the latest datetime in a column,
+  caching it and the column's last non-blank row against the spreadsheet's last modified time in '.cache/latest_dt.json'.
+
+Errors are logged through the calling script's logging configuration.
+"""
+
+import json
+import logging
+import os
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+import gspread
+from gspread.utils import absolute_range_name
+from gspread.worksheet import Worksheet
+
+# Matches the accepted Timestamp formats: '2025-06-22 13:45[:08]' and 'Jun 22, 2025, 1:45[:08] PM'
+TIMESTAMP_RE = re.compile(
+    r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2}) (?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?::(?P<second>\d{1,2}))?'
+    r'|(?P<mon>[A-Za-z]{3}) (?P<day12>\d{1,2}), (?P<year12>\d{4}), '
+    r'(?P<hour12>\d{1,2}):(?P<minute12>\d{1,2})(?::(?P<second12>\d{1,2}))? (?P<ampm>[AaPp][Mm])'
+)
+PADDED_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}(?::\d{2})?')
+SHEETS_EPOCH = datetime(1899, 12, 30)  # Day zero of Google Sheets date serial numbers
+MONTHS = {name: number for number, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+TAIL_ROWS = 6  # Rows re-read above the last row found by the previous run when looking for the latest timestamp
+LATEST_CACHE_PATH = os.path.join('.cache', 'latest_dt.json')
+MAX_API_RETRIES = 5
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 32.0
+
+_CLIENT_CACHE: Dict[str, gspread.Client] = {}
+
+def get_gspread_client(credentials_path: str) -> gspread.Client:
+    """Authenticate and return a gspread client, reusing the one already authorized for this key file."""
+    if credentials_path in _CLIENT_CACHE:
+        return _CLIENT_CACHE[credentials_path]
+    # google-auth credentials with gspread's default Sheets and Drive scopes
+    client = _CLIENT_CACHE[credentials_path] = gspread.service_account(filename=credentials_path)
+    return client
+
+def with_jitter_retry(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call a Sheets API function, retrying HTTP 429 responses with full-jitter exponential backoff.
+    Each wait is drawn uniformly up to the exponential cap, so scripts that hit the quota together
+    do not retry in lockstep.
+    """
+    for attempt in range(MAX_API_RETRIES + 1):
+        try:
+            return func(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            if e.response.status_code != 429 or attempt == MAX_API_RETRIES:
+                raise
+            wait = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+            logging.error(f"Rate limited calling {func.__name__}; retrying in {wait:.1f} s")
+            time.sleep(wait)
+
+def read_latest_cache(sheet_key: str) -> Dict[str, Any]:
+    """Return the latest-date cache entry for the given worksheet column, or an empty dict if there is none."""
+    try:
+        with open(LATEST_CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('sheet') == sheet_key:
+            return cache
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as e:
+        logging.error(f"Ignoring unreadable latest-date cache {LATEST_CACHE_PATH}: {e}")
+    return {}
+
+def write_latest_cache(sheet_key: str, revision: str, latest: datetime, last_row: int) -> None:
+    """Cache the latest datetime and the last non-blank row of the given worksheet column at a sheet revision."""
+    try:
+        os.makedirs(os.path.dirname(LATEST_CACHE_PATH), exist_ok=True)
+        with open(LATEST_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'sheet': sheet_key, 'revision': revision, 'latest': latest.isoformat(), 'row': last_row}, f)
+    except OSError as e:
+        logging.error(f"Could not write latest-date cache {LATEST_CACHE_PATH}: {e}")
+
+def parse_timestamp(ts: str) -> Optional[datetime]:
+    """Parse a timestamp in one of the accepted formats, or return None if it matches none of them."""
+    match = TIMESTAMP_RE.fullmatch(ts)
+    if match is None:
+        return None
+    try:
+        if match['year']:
+            return datetime(int(match['year']), int(match['month']), int(match['day']),
+                            int(match['hour']), int(match['minute']), int(match['second'] or 0))
+        month = MONTHS.get(match['mon'].lower())
+        hour = int(match['hour12'])
+        if month is None or not 1 <= hour <= 12:
+            return None
+        # 12-hour clock: 12 AM is midnight, 12 PM is noon
+        hour = hour % 12 + (12 if match['ampm'].upper() == 'PM' else 0)
+        return datetime(int(match['year12']), month, int(match['day12']),
+                        hour, int(match['minute12']), int(match['second12'] or 0))
+    except ValueError:
+        # Out-of-range fields such as a 13th month
+        return None
+
+def get_column_cells(ws: Worksheet, cell_range: str) -> List[Any]:
+    """
+    Fetch a single-column range as a flat list of unformatted cell values.
+    Requesting the column as one major dimension with dates as serial numbers keeps the response small
+    and avoids parsing formatted date strings.
+    """
+    response = with_jitter_retry(
+        ws.spreadsheet.values_get,
+        absolute_range_name(ws.title, cell_range),
+        params={
+            'majorDimension': 'COLUMNS',
+            'valueRenderOption': 'UNFORMATTED_VALUE',
+            'dateTimeRenderOption': 'SERIAL_NUMBER',
+        }
+    )
+    columns = response.get('values', [])
+    return columns[0] if columns else []
+
+def latest_datetime(cells: List[Any]) -> Optional[datetime]:
+    """Return the latest datetime among date serial numbers and timestamp strings, or None if none parse."""
+    latest = None
+    padded_iso = []
+    for cell in cells:
+        if isinstance(cell, (int, float)) and not isinstance(cell, bool):
+            # Date cells arrive as serial numbers: days since 1899-12-30
+            dt = SHEETS_EPOCH + timedelta(seconds=round(cell * 86400))
+        elif isinstance(cell, str) and cell:
+            if PADDED_ISO_RE.fullmatch(cell):
+                padded_iso.append(cell)
+                continue
+            dt = parse_timestamp(cell)
+        else:
+            continue
+        if dt is not None and (latest is None or dt > latest):
+            latest = dt
+    if padded_iso:
+        # Zero-padded ISO timestamps sort chronologically as strings, so only the latest needs parsing
+        latest_iso = parse_timestamp(max(padded_iso))
+        if latest_iso is None:
+            # The string maximum has out-of-range fields; parse them all instead
+            latest_iso = max((dt for dt in map(parse_timestamp, padded_iso) if dt is not None), default=None)
+        if latest_iso is not None and (latest is None or latest_iso > latest):
+            latest = latest_iso
+    return latest
+
+def latest_column_datetime(ws: Worksheet, column: str) -> Optional[datetime]:
+    """
+    Return the latest datetime in the given column of the worksheet, below the header row.
+    The result is cached against the spreadsheet's last modified time, so an unchanged sheet is not re-read.
+    Rows are appended in time order, so a changed sheet is read only from TAIL_ROWS above the last non-blank
+    row the previous run found; the whole column is read on the first run, or if that tail is blank.
+    """
+    sheet_key = f"{ws.spreadsheet.id}:{ws.id}:{column}"
+    try:
+        revision = with_jitter_retry(ws.spreadsheet.get_lastUpdateTime)
+    except Exception as e:
+        logging.error(f"Could not read last modified time of the sheet: {e}")
+        revision = None
+    cache = read_latest_cache(sheet_key)
+    try:
+        if revision and cache.get('revision') == revision:
+            return datetime.fromisoformat(cache['latest'])
+        cached_row = int(cache.get('row') or 0)
+    except (KeyError, TypeError, ValueError) as e:
+        logging.error(f"Ignoring unreadable latest-date cache {LATEST_CACHE_PATH}: {e}")
+        cached_row = 0
+    latest = None
+    if cached_row:
+        # The open-ended range ends at the last non-blank cell, so rows appended since are included
+        first_row = max(2, cached_row - TAIL_ROWS + 1)
+        cells = get_column_cells(ws, f"{column}{first_row}:{column}")
+        latest = latest_datetime(cells)
+    if latest is None:
+        first_row = 2
+        cells = get_column_cells(ws, f"{column}{first_row}:{column}")
+        latest = latest_datetime(cells)
+    if latest is not None and revision:
+        write_latest_cache(sheet_key, revision, latest, first_row + len(cells) - 1)
+    return latest
@@ -0,0 +1,57 @@
+"""Tests for import.py's Eastern-to-Pacific time conversion."""
+
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    # 'import' is a keyword, so the module cannot be imported with an import statement
+    import_py = importlib.import_module('import')
+except ImportError as e:
+    import_py = None
+    MISSING_DEPENDENCY = str(e)
+else:
+    MISSING_DEPENDENCY = ''
+
+
+@unittest.skipIf(import_py is None, f"import.py dependencies not installed: {MISSING_DEPENDENCY}")
+class ConvertTimesTest(unittest.TestCase):
+
+    def test_raw_time_with_zero_seconds_is_converted(self):
+        # Zero-padded Eastern exports with an hour of 10 or later and ':00' seconds have the same shape
+        # as the converted output, and must still be shifted
+        self.assertEqual(
+            import_py.convert_times_eastern_to_pacific(['2025-06-22 13:45:00', '2025-06-22 13:45:01']),
+            ['2025-06-22 10:45:00', '2025-06-22 10:45:00']
+        )
+        self.assertEqual(import_py.convert_time_eastern_to_pacific('2025-06-22 13:45:00'), '2025-06-22 10:45:00')
+
+    def test_vectorized_matches_single_conversion(self):
+        times = ['2025-06-22 00:15:29', '2025-06-22 9:05', 'Jun 22, 2025, 1:45:08 PM', '2025-11-02 01:30:00']
+        self.assertEqual(
+            import_py.convert_times_eastern_to_pacific(times),
+            [import_py.convert_time_eastern_to_pacific(t) for t in times]
+        )
+
+    def test_only_the_written_column_counts_as_converted(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, 'converted_times.json')
+            with mock.patch.object(import_py, 'CONVERTED_CACHE_PATH', cache_path):
+                written = ['2025-06-22 10:45:00', '2025-06-22 10:50:00', '2025-06-22 10:55:00']
+                self.assertFalse(import_py.times_already_converted('sheet:0:Time', written))
+                import_py.write_converted_times('sheet:0:Time', written)
+                self.assertTrue(import_py.times_already_converted('sheet:0:Time', written))
+                # Rows deleted from the top after the conversion
+                self.assertTrue(import_py.times_already_converted('sheet:0:Time', written[1:]))
+                # A new export, or raw times that happen to look converted
+                self.assertFalse(import_py.times_already_converted('other:0:Time', written))
+                self.assertFalse(import_py.times_already_converted('sheet:0:Time', ['2025-06-22 13:45:00']))
+
+
+if __name__ == '__main__':
+    unittest.main()